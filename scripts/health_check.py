@@ -2,29 +2,56 @@
 """헬스체크 스크립트"""
 
 import asyncio
+import importlib.util
 import sys
 import time
 from typing import Dict, Any
 import httpx
 import json
 
+try:
+    import orjson
+except ImportError:  # orjson은 선택 의존성
+    orjson = None
+
+
+# h2 패키지가 설치된 경우에만 HTTP/2 사용
+HTTP2_ENABLED = importlib.util.find_spec("h2") is not None
+
 
 class HealthChecker:
     """헬스체크 수행자"""
     
     def __init__(self, base_url: str = "http://localhost:8000"):
         self.base_url = base_url.rstrip("/")
-        self.client = httpx.AsyncClient(timeout=10.0)
+        # 동일 오리진에 대한 연결을 재사용하도록 풀 설정
+        self.client = httpx.AsyncClient(
+            base_url=self.base_url,
+            timeout=httpx.Timeout(10.0, connect=2.0),
+            transport=httpx.AsyncHTTPTransport(
+                http2=HTTP2_ENABLED,
+                retries=1,
+                limits=httpx.Limits(
+                    max_keepalive_connections=20,
+                    max_connections=20,
+                    keepalive_expiry=60.0
+                )
+            )
+        )
+        # 서비스별 헬스체크 경로 (최초 사용 시 생성 후 재사용)
+        self._service_paths: Dict[str, str] = {}
     
     async def check_main_health(self) -> Dict[str, Any]:
         """메인 헬스체크"""
         try:
-            response = await self.client.get(f"{self.base_url}/health")
+            start = time.perf_counter()
+            response = await self.client.get("/health")
+            response_time = (time.perf_counter() - start) * 1000
             response.raise_for_status()
             return {
                 "status": "healthy",
-                "response_time": response.elapsed.total_seconds() * 1000,
-                "data": response.json()
+                "response_time": response_time,
+                "data": orjson.loads(response.content) if orjson else response.json()
             }
         except Exception as e:
             return {
@@ -32,15 +59,25 @@ class HealthChecker:
                 "error": str(e)
             }
     
+    def _service_path(self, service: str) -> str:
+        """서비스 헬스체크 경로 반환"""
+        path = self._service_paths.get(service)
+        if path is None:
+            path = self._service_paths[service] = f"/{service}/health"
+        return path
+    
     async def check_service_health(self, service: str) -> Dict[str, Any]:
         """개별 서비스 헬스체크"""
         try:
-            response = await self.client.get(f"{self.base_url}/{service}/health")
+            start = time.perf_counter()
+            response = await self.client.get(self._service_path(service))
+            response_time = (time.perf_counter() - start) * 1000
             response.raise_for_status()
+            # 상태 코드만 필요하므로 본문은 파싱하지 않음
             return {
                 "status": "healthy",
-                "response_time": response.elapsed.total_seconds() * 1000,
-                "data": response.json()
+                "response_time": response_time,
+                "data": None
             }
         except httpx.HTTPStatusError as e:
             return {
@@ -57,12 +94,15 @@ class HealthChecker:
     async def check_root_endpoint(self) -> Dict[str, Any]:
         """루트 엔드포인트 확인"""
         try:
-            response = await self.client.get(f"{self.base_url}/")
+            start = time.perf_counter()
+            response = await self.client.get("/")
+            response_time = (time.perf_counter() - start) * 1000
             response.raise_for_status()
+            # 상태 코드만 필요하므로 본문은 파싱하지 않음
             return {
                 "status": "healthy",
-                "response_time": response.elapsed.total_seconds() * 1000,
-                "data": response.json()
+                "response_time": response_time,
+                "data": None
             }
         except Exception as e:
             return {
@@ -70,7 +110,7 @@ class HealthChecker:
                 "error": str(e)
             }
     
-    async def full_health_check(self) -> Dict[str, Any]:
+    async def full_health_check(self, include_root: bool = False) -> Dict[str, Any]:
         """전체 헬스체크"""
         results = {
             "timestamp": time.time(),
@@ -78,18 +118,22 @@ class HealthChecker:
             "checks": {}
         }
         
-        # 루트 엔드포인트 체크
-        print("🔍 루트 엔드포인트 확인 중...")
-        root_result = await self.check_root_endpoint()
-        results["checks"]["root"] = root_result
-        
-        if root_result["status"] != "healthy":
-            results["overall_status"] = "unhealthy"
-            return results
-        
-        # 메인 헬스체크
+        # 루트 엔드포인트는 /health와 같은 정보만 제공하므로 요청 시에만 확인
         print("🏥 메인 헬스체크 수행 중...")
-        main_result = await self.check_main_health()
+        if include_root:
+            print("🔍 루트 엔드포인트 확인 중...")
+            root_result, main_result = await asyncio.gather(
+                self.check_root_endpoint(),
+                self.check_main_health()
+            )
+            results["checks"]["root"] = root_result
+            
+            if root_result["status"] != "healthy":
+                results["overall_status"] = "unhealthy"
+                return results
+        else:
+            main_result = await self.check_main_health()
+        
         results["checks"]["main"] = main_result
         
         if main_result["status"] != "healthy":
@@ -98,16 +142,27 @@ class HealthChecker:
         
         # 활성화된 서비스 목록 가져오기
         try:
-            enabled_services = main_result["data"]["data"]["services"].keys()
+            enabled_services = list(main_result["data"]["data"]["services"].keys())
             print(f"📋 활성화된 서비스: {', '.join(enabled_services)}")
         except (KeyError, TypeError):
             enabled_services = ["confluence", "jira", "slack"]  # 기본값
         
-        # 개별 서비스 헬스체크
+        # 개별 서비스 헬스체크 (동시 수행)
+        service_results = await asyncio.gather(
+            *[self.check_service_health(service) for service in enabled_services],
+            return_exceptions=True
+        )
+        
         unhealthy_services = []
-        for service in enabled_services:
-            print(f"🔧 {service} 서비스 헬스체크 중...")
-            service_result = await self.check_service_health(service)
+        for service, service_result in zip(
+            enabled_services, service_results, strict=True
+        ):
+            print(f"🔧 {service} 서비스 헬스체크 완료")
+            if isinstance(service_result, BaseException):
+                service_result = {
+                    "status": "unhealthy",
+                    "error": str(service_result)
+                }
             results["checks"][service] = service_result
             
             if service_result["status"] == "unhealthy":
@@ -178,6 +233,11 @@ async def main():
         action="store_true",
         help="JSON 형식으로 결과 출력"
     )
+    parser.add_argument(
+        "--include-root",
+        action="store_true",
+        help="루트 엔드포인트도 함께 확인"
+    )
     parser.add_argument(
         "--exit-code",
         action="store_true",
@@ -189,7 +249,7 @@ async def main():
     checker = HealthChecker(args.url)
     
     try:
-        results = await checker.full_health_check()
+        results = await checker.full_health_check(include_root=args.include_root)
         
         if args.json:
             print(json.dumps(results, indent=2, ensure_ascii=False))
@@ -22,15 +22,30 @@ def setup_environment():
             print(f"📝 {env_example}을 참고하여 .env 파일을 생성하세요.")
         sys.exit(1)
     
-    # Python 경로 설정
+    # Python 경로 설정 (서버 프로세스가 상속하도록 환경변수로 전달)
     src_path = project_root / "src"
-    if str(src_path) not in sys.path:
-        sys.path.insert(0, str(src_path))
+    python_path = os.environ.get("PYTHONPATH", "")
+    os.environ["PYTHONPATH"] = (
+        str(src_path) + os.pathsep + python_path if python_path else str(src_path)
+    )
     
     print(f"🏠 프로젝트 루트: {project_root}")
     print(f"📁 Python 경로에 추가: {src_path}")
 
 
+def _dependencies_up_to_date() -> bool:
+    """가상환경이 lock 파일보다 최신인지 확인"""
+    venv_cfg = Path(".venv") / "pyvenv.cfg"
+    if not venv_cfg.exists():
+        return False
+    
+    venv_mtime = venv_cfg.stat().st_mtime
+    for manifest in (Path("uv.lock"), Path("pyproject.toml")):
+        if manifest.exists() and manifest.stat().st_mtime > venv_mtime:
+            return False
+    return True
+
+
 def check_dependencies():
     """의존성 확인"""
     print("📦 의존성 확인 중...")
@@ -43,10 +58,17 @@ def check_dependencies():
         print("❌ uv가 설치되지 않았습니다. 'pip install uv'로 설치하세요.")
         sys.exit(1)
     
+    # lock 파일이 변경되지 않았으면 동기화 생략
+    if _dependencies_up_to_date():
+        print("✅ 의존성이 최신 상태입니다")
+        return
+    
     # 의존성 동기화
     print("🔄 의존성 동기화 중...")
     try:
         subprocess.run(["uv", "sync"], check=True)
+        # 동기화 시점을 기록하여 다음 실행 시 비교에 사용
+        (Path(".venv") / "pyvenv.cfg").touch()
         print("✅ 의존성 동기화 완료")
     except subprocess.CalledProcessError:
         print("❌ 의존성 동기화 실패")
@@ -57,19 +79,21 @@ def start_server():
     """개발 서버 시작"""
     print("🚀 개발 서버 시작 중...")
     
-    # uvicorn으로 서버 시작
+    # uvicorn으로 프로세스를 교체 (종료 시그널은 uvicorn이 직접 처리)
+    command = [
+        "uv", "run", "uvicorn",
+        "src.main:app",
+        "--host", "127.0.0.1",
+        "--port", "8000",
+        "--reload",
+        "--loop", "uvloop",
+        "--http", "httptools",
+        "--log-level", "info"
+    ]
+    sys.stdout.flush()
     try:
-        subprocess.run([
-            "uv", "run", "uvicorn",
-            "src.main:app",
-            "--host", "127.0.0.1",
-            "--port", "8000",
-            "--reload",
-            "--log-level", "info"
-        ], check=True)
-    except KeyboardInterrupt:
-        print("\n🛑 서버가 중지되었습니다.")
-    except subprocess.CalledProcessError as e:
+        os.execvp(command[0], command)
+    except OSError as e:
         print(f"❌ 서버 시작 실패: {e}")
         sys.exit(1)
 
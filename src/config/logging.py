@@ -1,10 +1,19 @@
 """로깅 설정"""
 
+import atexit
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
+from functools import cached_property
 from typing import Dict, Any
 import structlog
-from pydantic import BaseModel
+from pydantic import BaseModel, computed_field, field_validator
+
+try:
+    import orjson
+except ImportError:  # orjson은 선택 의존성 (없으면 표준 json 사용)
+    orjson = None
 
 
 class LogConfig(BaseModel):
@@ -13,39 +22,104 @@ class LogConfig(BaseModel):
     level: str = "INFO"
     format: str = "json"  # json 또는 text
     
+    @field_validator("level")
+    @classmethod
+    def validate_level(cls, v: str) -> str:
+        # getLevelName()은 알 수 없는 이름에 "Level X" 문자열을 반환하므로 미리 검증
+        level = v.upper()
+        if level not in logging.getLevelNamesMapping():
+            raise ValueError(f"알 수 없는 로그 레벨입니다: {v}")
+        return level
+    
+    @computed_field
+    @cached_property
+    def level_no(self) -> int:
+        """숫자 로그 레벨 (한 번만 계산)"""
+        return logging.getLevelNamesMapping()[self.level]
+    
+
+# 실제 출력(포맷팅 + write)은 백그라운드 리스너 스레드에서 수행
+_log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+_log_listener: QueueListener = None
+
+
+def start_log_listener() -> None:
+    """로그 리스너 스레드 시작 (이미 실행 중이면 무시)"""
+    global _log_listener
+    if _log_listener is None:
+        formatter = logging.Formatter("%(message)s")
+        handler = logging.StreamHandler(sys.stdout)
+        handler.setFormatter(formatter)
+        _log_listener = QueueListener(_log_queue, handler)
+        _log_listener.start()
+
+
+def stop_log_listener() -> None:
+    """대기 중인 로그를 모두 출력한 뒤 리스너 스레드 종료"""
+    global _log_listener
+    if _log_listener is not None:
+        _log_listener.stop()
+        _log_listener = None
+
+
+def _flush_log_queue_at_exit() -> None:
+    """종료 직전 큐에 남은 로그 출력 (lifespan 종료 이후 기록된 로그 포함)"""
+    start_log_listener()
+    stop_log_listener()
+
+
+def _orjson_dumps(obj: Any, **kwargs: Any) -> str:
+    """orjson 직렬화 (stdlib 로거에 전달하기 위해 문자열로 변환)"""
+    return orjson.dumps(obj, default=kwargs.get("default")).decode()
+
 
 def setup_logging(config: LogConfig) -> None:
     """구조화된 로깅 설정"""
     
-    # 기본 로깅 레벨 설정
+    level = config.level_no
+    
+    # 레코드마다 수행하는 스레드/프로세스/호출 위치 조회 생략
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+    logging._srcfile = None
+    
+    # 요청 처리 중에는 큐에 넣기만 하고 출력은 리스너 스레드가 담당
     logging.basicConfig(
-        level=getattr(logging, config.level.upper()),
-        stream=sys.stdout,
+        level=level,
+        handlers=[QueueHandler(_log_queue)],
         format="%(message)s"
     )
+    start_log_listener()
+    atexit.register(_flush_log_queue_at_exit)
     
-    # structlog 프로세서 설정
+    # structlog 프로세서 설정 (레벨 필터링은 바운드 로거에서 처리)
     processors = [
-        structlog.stdlib.filter_by_level,
         structlog.stdlib.add_logger_name,
         structlog.stdlib.add_log_level,
-        structlog.stdlib.PositionalArgumentsFormatter(),
         structlog.processors.TimeStamper(fmt="iso"),
-        structlog.processors.StackInfoRenderer(),
-        structlog.processors.format_exc_info,
-        structlog.processors.UnicodeDecoder(),
     ]
     
+    # 스택/예외 정보 렌더링은 디버그 레벨에서만 사용
+    if level <= logging.DEBUG:
+        processors.extend([
+            structlog.processors.StackInfoRenderer(),
+            structlog.processors.format_exc_info,
+        ])
+    
     # 출력 형식에 따른 렌더러 선택
     if config.format.lower() == "json":
-        processors.append(structlog.processors.JSONRenderer())
+        if orjson is not None:
+            processors.append(structlog.processors.JSONRenderer(serializer=_orjson_dumps))
+        else:
+            processors.append(structlog.processors.JSONRenderer())
     else:
         processors.append(structlog.dev.ConsoleRenderer(colors=True))
     
     # structlog 설정
     structlog.configure(
         processors=processors,
-        wrapper_class=structlog.stdlib.BoundLogger,
+        wrapper_class=structlog.make_filtering_bound_logger(level),
         logger_factory=structlog.stdlib.LoggerFactory(),
         context_class=dict,
         cache_logger_on_first_use=True,
@@ -67,20 +141,27 @@ def log_request_response(
 ) -> None:
     """HTTP 요청/응답 로깅"""
     logger = get_logger("http")
-    
-    log_data = {
-        "method": method,
-        "url": url,
-        "status_code": status_code,
-        "response_time_ms": response_time * 1000 if response_time else None,
-        **kwargs
-    }
+    response_time_ms = response_time * 1000 if response_time else None
     
     if error:
-        log_data["error"] = error
-        logger.error("HTTP request failed", **log_data)
+        logger.error(
+            "HTTP request failed",
+            method=method,
+            url=url,
+            status_code=status_code,
+            response_time_ms=response_time_ms,
+            error=error,
+            **kwargs
+        )
     else:
-        logger.info("HTTP request completed", **log_data)
+        logger.info(
+            "HTTP request completed",
+            method=method,
+            url=url,
+            status_code=status_code,
+            response_time_ms=response_time_ms,
+            **kwargs
+        )
 
 
 def log_mcp_operation(
@@ -93,17 +174,24 @@ def log_mcp_operation(
 ) -> None:
     """MCP 작업 로깅"""
     logger = get_logger("mcp")
-    
-    log_data = {
-        "service": service,
-        "operation": operation,
-        "success": success,
-        "duration_ms": duration * 1000 if duration else None,
-        **kwargs
-    }
+    duration_ms = duration * 1000 if duration else None
     
     if error:
-        log_data["error"] = error
-        logger.error("MCP operation failed", **log_data)
+        logger.error(
+            "MCP operation failed",
+            service=service,
+            operation=operation,
+            success=success,
+            duration_ms=duration_ms,
+            error=error,
+            **kwargs
+        )
     else:
-        logger.info("MCP operation completed", **log_data)
\ No newline at end of file
+        logger.info(
+            "MCP operation completed",
+            service=service,
+            operation=operation,
+            success=success,
+            duration_ms=duration_ms,
+            **kwargs
+        )
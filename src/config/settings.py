@@ -1,7 +1,8 @@
 """환경별 설정 관리"""
 
 import os
-from typing import Dict, List, Optional
+from functools import cached_property
+from typing import Dict, FrozenSet, List, Optional
 from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings
 
@@ -36,6 +37,15 @@ class AppSettings(BaseConfig):
         description="활성화된 MCP 서비스 목록 (콤마로 구분)"
     )
     mcp_mount_path: str = Field(default="/mcp", description="MCP 마운트 경로")
+    health_check_delay: float = Field(
+        default=30.0,
+        description="최근 정상 확인된 서비스의 헬스체크 프로브 생략 시간(초)"
+    )
+    
+    # 공유 HTTP 클라이언트 연결 풀 설정
+    http_max_connections: int = Field(default=100, description="공유 HTTP 클라이언트 최대 동시 연결 수")
+    http_max_keepalive_connections: int = Field(default=20, description="공유 HTTP 클라이언트 최대 keep-alive 연결 수")
+    http_keepalive_expiry: float = Field(default=30.0, description="공유 HTTP 클라이언트 keep-alive 유지 시간(초)")
     
     # 로깅 설정
     log_level: str = Field(default="INFO", description="로그 레벨")
@@ -49,11 +59,16 @@ class AppSettings(BaseConfig):
             raise ValueError(f"환경은 {allowed} 중 하나여야 합니다")
         return v.lower()
     
-    def get_enabled_services(self) -> List[str]:
-        """활성화된 서비스 목록을 리스트로 반환"""
+    @cached_property
+    def enabled_services(self) -> List[str]:
+        """활성화된 서비스 목록 (최초 접근 시 한 번만 파싱)"""
         if isinstance(self.mcp_enabled_services, str):
             return [s.strip() for s in self.mcp_enabled_services.split(",") if s.strip()]
         return self.mcp_enabled_services or []
+    
+    def get_enabled_services(self) -> List[str]:
+        """활성화된 서비스 목록을 리스트로 반환"""
+        return self.enabled_services
 
 
 class SecuritySettings(BaseConfig):
@@ -72,8 +87,17 @@ class SecuritySettings(BaseConfig):
     @classmethod
     def parse_cors_origins(cls, v):
         if isinstance(v, str):
-            return [s.strip() for s in v.split(",") if s.strip()]
-        return v or ["*"]
+            v = [s.strip() for s in v.split(",") if s.strip()]
+        v = v or ["*"]
+        # 와일드카드가 있으면 다른 오리진은 의미가 없으므로 정리
+        if "*" in v:
+            return ["*"]
+        return v
+    
+    @cached_property
+    def allowed_origins(self) -> FrozenSet[str]:
+        """CORS 허용 오리진 집합 (요청별 O(1) 조회용)"""
+        return frozenset(self.cors_origins)
 
 
 class ConfluenceSettings(BaseConfig):
@@ -87,6 +111,20 @@ class ConfluenceSettings(BaseConfig):
     timeout: float = Field(default=10.0, description="요청 타임아웃(초)")
     max_retries: int = Field(default=3, description="최대 재시도 횟수")
     retry_delay: float = Field(default=1.0, description="재시도 지연(초)")
+    retry_base_delay: float = Field(default=0.1, description="재시도 백오프 기본 지연(초)")
+    retry_max_delay: float = Field(default=5.0, description="재시도 백오프 최대 지연(초)")
+    retry_jitter: bool = Field(default=True, description="재시도 백오프 full jitter 사용 여부")
+    
+    # 응답 캐시 설정 (0이면 비활성화)
+    cache_ttl: float = Field(default=60.0, description="조회 응답 캐시 유지 시간(초)")
+    cache_max_size: int = Field(default=256, description="조회 응답 캐시 최대 항목 수")
+    
+    # 페이지 조회 배치 설정 (batch_window가 0이면 비활성화)
+    batch_window: float = Field(default=0.01, description="페이지 조회 요청을 모으는 시간(초)")
+    batch_max_size: int = Field(default=50, description="한 번에 묶어 조회할 최대 페이지 수")
+    
+    # 요청 완료 로그 샘플링 (N건당 1건 기록, 1이면 모두 기록)
+    completion_log_sample: int = Field(default=100, ge=1, description="완료 로그를 기록할 요청 간격")
     
     # 검색 설정
     max_results: int = Field(default=100, description="최대 검색 결과 수")
@@ -108,6 +146,18 @@ class JiraSettings(BaseConfig):
     timeout: float = Field(default=10.0, description="요청 타임아웃(초)")
     max_retries: int = Field(default=3, description="최대 재시도 횟수")
     
+    # 연결 풀 설정 (동시 페이지 조회 시 대기열이 생기지 않도록 여유 있게 설정)
+    max_connections: int = Field(default=100, description="최대 동시 연결 수")
+    max_keepalive_connections: int = Field(default=40, description="최대 keep-alive 연결 수")
+    keepalive_expiry: float = Field(default=30.0, description="keep-alive 유지 시간(초)")
+    http2: bool = Field(default=True, description="HTTP/2 사용 여부 (h2 패키지 필요)")
+    
+    # 조회 응답 캐시 설정 (TTL이 0이면 비활성화)
+    search_cache_ttl: float = Field(default=30.0, description="검색 결과 캐시 유지 시간(초)")
+    issue_cache_ttl: float = Field(default=240.0, description="이슈 조회 캐시 유지 시간(초)")
+    project_cache_ttl: float = Field(default=900.0, description="프로젝트 조회 캐시 유지 시간(초)")
+    cache_max_size: int = Field(default=512, description="조회 응답 캐시 최대 항목 수")
+    
     @field_validator("base_url")
     @classmethod
     def validate_base_url(cls, v):
@@ -123,6 +173,11 @@ class SlackSettings(BaseConfig):
     
     timeout: float = Field(default=10.0, description="요청 타임아웃(초)")
     max_retries: int = Field(default=3, description="최대 재시도 횟수")
+    
+    # 조회 응답 캐시 설정 (TTL이 0이면 비활성화)
+    channel_cache_ttl: float = Field(default=60.0, description="채널 정보 캐시 유지 시간(초)")
+    user_cache_ttl: float = Field(default=300.0, description="사용자 정보 캐시 유지 시간(초)")
+    cache_max_size: int = Field(default=1024, description="조회 응답 캐시 최대 항목 수")
 
 
 class DatabaseSettings(BaseConfig):
@@ -138,6 +193,7 @@ class Settings:
     
     def __init__(self):
         self.app = AppSettings()
+        self._enabled = frozenset(self.app.get_enabled_services())
         self.security = SecuritySettings()
         self.confluence = ConfluenceSettings() if self._is_service_enabled("confluence") else None
         self.jira = JiraSettings() if self._is_service_enabled("jira") else None
@@ -148,7 +204,7 @@ class Settings:
     
     def _is_service_enabled(self, service: str) -> bool:
         """서비스가 활성화되어 있는지 확인"""
-        return service in self.app.get_enabled_services()
+        return service in self._enabled
     
     def get_service_configs(self) -> Dict[str, BaseConfig]:
         """활성화된 서비스 설정들을 반환"""
@@ -1,17 +1,21 @@
 """AIDT MCP FastAPI 메인 애플리케이션"""
 
 import asyncio
+import importlib
+import time
 from contextlib import asynccontextmanager
-from typing import Dict, Any
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, Dict
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from fastapi_mcp import FastApiMCP
 import structlog
 
 from .config.settings import settings
-from .config.logging import setup_logging, LogConfig
+from .config.logging import setup_logging, start_log_listener, stop_log_listener, LogConfig
 from .shared.middleware import (
     RequestLoggingMiddleware,
     ErrorHandlingMiddleware,
@@ -20,6 +24,8 @@ from .shared.middleware import (
 )
 from .shared.models import HealthCheckResponse, ServiceStatus
 from .shared.exceptions import MCPBaseException
+from .shared.http import close_http_client
+from .shared.utils import FastJSONResponse, json_dumps
 
 # 로깅 설정
 setup_logging(LogConfig(
@@ -29,10 +35,19 @@ setup_logging(LogConfig(
 
 logger = structlog.get_logger(__name__)
 
+# 헬스체크 응답 캐시 (짧은 TTL로 중복 프로브 병합)
+_HEALTH_CACHE_TTL = 1.0
+_HEALTH_PROBE_TIMEOUT = 2.0
+_health_cache: Dict[str, Any] = {"ts": 0.0, "body": None}
+_health_lock = asyncio.Lock()
+# 서비스별 마지막 정상 확인 시각 (monotonic)
+_last_ok: Dict[str, float] = {}
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """애플리케이션 생명주기 관리"""
+    start_log_listener()
     logger.info("AIDT MCP Server starting up", version=settings.app.version)
     
     # 서비스별 HTTP 클라이언트 초기화
@@ -44,65 +59,77 @@ async def lifespan(app: FastAPI):
     
     # 서비스별 리소스 정리
     await _cleanup_services()
+    
+    # 서비스 정리 후 공용 HTTP 연결 풀 종료
+    await close_http_client()
+    
+    # 큐에 남은 로그를 모두 출력하고 리스너 종료
+    stop_log_listener()
 
 
 async def _initialize_services():
-    """서비스별 초기화"""
+    """서비스별 초기화 (동시 수행)"""
     enabled_services = settings.app.get_enabled_services()
     logger.info("Initializing services", enabled_services=enabled_services)
     
-    # 활성화된 서비스별 클라이언트 초기화
-    for service_name in enabled_services:
-        try:
-            if service_name == "confluence" and settings.confluence:
-                from .mcps.confluence.client import get_confluence_client
-                client = await get_confluence_client()
-                app.state.confluence_client = client
-                logger.info("Confluence client initialized")
-                
-            elif service_name == "jira" and settings.jira:
-                from .mcps.jira.client import get_jira_client
-                client = await get_jira_client()
-                app.state.jira_client = client
-                logger.info("JIRA client initialized")
-                
-            elif service_name == "slack" and settings.slack:
-                from .mcps.slack.client import get_slack_client
-                client = await get_slack_client()
-                app.state.slack_client = client
-                logger.info("Slack client initialized")
-                
-            elif service_name == "calculator":
-                from .mcps.calculator.client import initialize_calculator_client
-                client = await initialize_calculator_client()
-                app.state.calculator_client = client
-                logger.info("Calculator client initialized")
-                
-        except Exception as e:
-            logger.error(f"Failed to initialize {service_name} service", error=str(e))
-            # 개별 서비스 초기화 실패는 전체 시스템을 중단시키지 않음
+    # 활성화된 서비스별 클라이언트를 동시에 초기화
+    results = await asyncio.gather(
+        *[_initialize_service(name) for name in enabled_services],
+        return_exceptions=True
+    )
+    
+    initialized = [
+        name
+        for name, result in zip(enabled_services, results, strict=True)
+        if result is True
+    ]
+    logger.info("Services initialized", initialized_services=initialized)
+
+
+async def _initialize_service(service_name: str) -> bool:
+    """개별 서비스 초기화"""
+    spec = SERVICE_REGISTRY.get(service_name)
+    if spec is None or not getattr(settings, spec.settings_attr, None):
+        return False
+    
+    try:
+        client_factory = _import_attr(spec.client_factory)
+        client = await client_factory()
+        app.state.clients[service_name] = client
+        logger.info(f"{spec.display_name} client initialized")
+        return True
+        
+    except Exception as e:
+        logger.error(f"Failed to initialize {service_name} service", error=str(e))
+        # 개별 서비스 초기화 실패는 전체 시스템을 중단시키지 않음
+        return False
 
 
 async def _cleanup_services():
-    """서비스별 정리"""
+    """서비스별 정리 (동시 수행)"""
     logger.info("Cleaning up services")
     
-    # HTTP 클라이언트 정리
-    if hasattr(app.state, "confluence_client"):
-        await app.state.confluence_client.aclose()
-        logger.info("Confluence client closed")
-    
-    if hasattr(app.state, "jira_client"):
-        await app.state.jira_client.aclose()
-        logger.info("JIRA client closed")
-    
-    if hasattr(app.state, "slack_client"):
-        await app.state.slack_client.aclose()
-        logger.info("Slack client closed")
+    clients = app.state.clients
+    await asyncio.gather(
+        *[_cleanup_service(name, client) for name, client in clients.items()],
+        return_exceptions=True
+    )
+    clients.clear()
+
+
+async def _cleanup_service(service_name: str, client: Any) -> None:
+    """개별 서비스 정리"""
+    spec = SERVICE_REGISTRY[service_name]
     
-    # Calculator는 HTTP 클라이언트가 아니므로 별도 정리 불필요
-    if hasattr(app.state, "calculator_client"):
-        logger.info("Calculator client cleaned up")
+    # Calculator처럼 HTTP 클라이언트가 없는 서비스는 별도 정리 불필요
+    if spec.closeable:
+        try:
+            await client.close()
+            logger.info(f"{spec.display_name} client closed")
+        except Exception as e:
+            logger.error(f"Failed to close {spec.display_name} client", error=str(e))
+    else:
+        logger.info(f"{spec.display_name} client cleaned up")
 
 
 # FastAPI 애플리케이션 생성
@@ -114,10 +141,13 @@ app = FastAPI(
     lifespan=lifespan
 )
 
+# 초기화된 서비스 클라이언트 (서비스 이름 -> 클라이언트)
+app.state.clients = {}
+
 # CORS 설정
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=settings.security.cors_origins,
+    allow_origins=settings.security.allowed_origins,
     allow_credentials=True,
     allow_methods=settings.security.cors_methods,
     allow_headers=settings.security.cors_headers,
@@ -171,7 +201,7 @@ async def http_exception_handler(request, exc: HTTPException):
 
 
 # 기본 라우터
-@app.get("/", response_model=Dict[str, Any])
+@app.get("/", response_model=Dict[str, Any], response_class=FastJSONResponse)
 async def root():
     """루트 엔드포인트"""
     return {
@@ -184,36 +214,58 @@ async def root():
 
 
 @app.get("/health", response_model=HealthCheckResponse)
-async def health_check():
+async def health_check(
+    fresh: bool = Query(False, description="캐시를 무시하고 새로 확인")
+):
     """헬스체크 엔드포인트"""
-    service_statuses = {}
+    if not fresh and _is_health_cache_fresh():
+        return _health_json_response(_health_cache["body"])
     
-    # 활성화된 서비스별 상태 확인
-    for service_name in settings.app.get_enabled_services():
-        try:
-            if service_name == "confluence" and hasattr(app.state, "confluence_client"):
-                status = await _check_confluence_health()
-            elif service_name == "jira" and hasattr(app.state, "jira_client"):
-                status = await _check_jira_health()
-            elif service_name == "slack" and hasattr(app.state, "slack_client"):
-                status = await _check_slack_health()
-            elif service_name == "calculator" and hasattr(app.state, "calculator_client"):
-                status = await _check_calculator_health()
-            else:
-                status = ServiceStatus(
-                    name=service_name,
-                    status="unconfigured",
-                    error="Service not configured or initialized"
-                )
-            
-            service_statuses[service_name] = status.dict()
-            
-        except Exception as e:
-            service_statuses[service_name] = ServiceStatus(
+    async with _health_lock:
+        # 대기 중 다른 요청이 캐시를 갱신했으면 재사용
+        if not fresh and _is_health_cache_fresh():
+            return _health_json_response(_health_cache["body"])
+        
+        # 직렬화된 바이트를 캐시하여 캐시 히트 시 재직렬화 생략
+        response = await _build_health_response(fresh=fresh)
+        body = json_dumps(response.model_dump(mode="json"))
+        _health_cache["ts"] = time.monotonic()
+        _health_cache["body"] = body
+        return _health_json_response(body)
+
+
+def _health_json_response(body: bytes) -> Response:
+    """직렬화된 헬스체크 응답 생성"""
+    return Response(content=body, media_type="application/json")
+
+
+def _is_health_cache_fresh() -> bool:
+    """캐시된 헬스체크 응답이 유효한지 확인"""
+    return (
+        _health_cache["body"] is not None
+        and time.monotonic() - _health_cache["ts"] < _HEALTH_CACHE_TTL
+    )
+
+
+async def _build_health_response(fresh: bool = False) -> HealthCheckResponse:
+    """서비스별 상태를 확인하여 헬스체크 응답 생성"""
+    enabled_services = settings.app.get_enabled_services()
+    
+    # 활성화된 서비스별 상태를 동시에 확인
+    results = await asyncio.gather(
+        *[_probe_service_health(name, fresh=fresh) for name in enabled_services],
+        return_exceptions=True
+    )
+    
+    service_statuses = {}
+    for service_name, status in zip(enabled_services, results, strict=True):
+        if isinstance(status, BaseException):
+            status = ServiceStatus(
                 name=service_name,
                 status="unhealthy",
-                error=str(e)
-            ).dict()
+                error=str(status)
+            )
+        service_statuses[service_name] = status.model_dump()
     
     # 전체 상태 결정
     overall_status = "healthy"
@@ -230,6 +282,37 @@ async def health_check():
     )
 
 
+async def _probe_service_health(service_name: str, fresh: bool = False) -> ServiceStatus:
+    """개별 서비스 헬스체크 (타임아웃 적용)"""
+    # 최근에 정상으로 확인된 서비스는 다시 프로브하지 않음
+    last_ok = _last_ok.get(service_name)
+    if (
+        not fresh
+        and last_ok is not None
+        and time.monotonic() - last_ok < settings.app.health_check_delay
+    ):
+        return ServiceStatus(name=service_name, status="healthy")
+    
+    _last_ok.pop(service_name, None)
+    try:
+        async with asyncio.timeout(_HEALTH_PROBE_TIMEOUT):
+            spec = SERVICE_REGISTRY.get(service_name)
+            if spec is not None and service_name in app.state.clients:
+                status = await spec.health_fn()
+            else:
+                return ServiceStatus(
+                    name=service_name,
+                    status="unconfigured",
+                    error="Service not configured or initialized"
+                )
+    except TimeoutError:
+        return ServiceStatus(name=service_name, status="unhealthy", error="timeout")
+    
+    if status.status == "healthy":
+        _last_ok[service_name] = time.monotonic()
+    return status
+
+
 async def _check_confluence_health() -> ServiceStatus:
     """Confluence 서비스 헬스체크"""
     # 실제 구현에서는 간단한 API 호출로 상태 확인
@@ -249,7 +332,7 @@ async def _check_slack_health() -> ServiceStatus:
 async def _check_calculator_health() -> ServiceStatus:
     """Calculator 서비스 헬스체크"""
     try:
-        client = app.state.calculator_client
+        client = app.state.clients["calculator"]
         health = await client.health_check()
         if health["status"] == "healthy":
             return ServiceStatus(name="calculator", status="healthy")
@@ -259,6 +342,60 @@ async def _check_calculator_health() -> ServiceStatus:
         return ServiceStatus(name="calculator", status="unhealthy", error=str(e))
 
 
+@dataclass(frozen=True)
+class ServiceSpec:
+    """서비스 등록 정보"""
+    
+    display_name: str
+    settings_attr: str
+    client_factory: str  # "모듈:함수" 형식
+    router_module: str
+    health_fn: Callable[[], Awaitable[ServiceStatus]]
+    closeable: bool = True
+
+
+# 서비스 레지스트리 (새 서비스는 여기에 추가)
+SERVICE_REGISTRY: Dict[str, ServiceSpec] = {
+    "confluence": ServiceSpec(
+        display_name="Confluence",
+        settings_attr="confluence",
+        client_factory=".mcps.confluence.client:get_confluence_client",
+        router_module=".mcps.confluence.router",
+        health_fn=_check_confluence_health,
+    ),
+    "jira": ServiceSpec(
+        display_name="JIRA",
+        settings_attr="jira",
+        client_factory=".mcps.jira.client:get_jira_client",
+        router_module=".mcps.jira.router",
+        health_fn=_check_jira_health,
+    ),
+    "slack": ServiceSpec(
+        display_name="Slack",
+        settings_attr="slack",
+        client_factory=".mcps.slack.client:get_slack_client",
+        router_module=".mcps.slack.router",
+        health_fn=_check_slack_health,
+    ),
+    "calculator": ServiceSpec(
+        display_name="Calculator",
+        settings_attr="calculator",
+        client_factory=".mcps.calculator.client:initialize_calculator_client",
+        router_module=".mcps.calculator.router",
+        health_fn=_check_calculator_health,
+        closeable=False,
+    ),
+}
+
+
+@lru_cache(maxsize=None)
+def _import_attr(path: str) -> Any:
+    """"모듈:속성" 경로에서 객체 로드 (첫 사용 시 import 후 캐시)"""
+    module_name, _, attr = path.partition(":")
+    module = importlib.import_module(module_name, package=__package__)
+    return getattr(module, attr)
+
+
 # 활성화된 서비스별 라우터 등록
 def register_service_routers():
     """서비스 라우터 등록 (일반 FastAPI 엔드포인트)"""
@@ -266,38 +403,14 @@ def register_service_routers():
     logger.info("Registering service routers", enabled_services=enabled_services)
     
     for service_name in enabled_services:
+        spec = SERVICE_REGISTRY.get(service_name)
+        if spec is None or not getattr(settings, spec.settings_attr, None):
+            continue
+        
         try:
-            if service_name == "confluence" and settings.confluence:
-                from .mcps.confluence.router import router as confluence_router
-                app.include_router(
-                    confluence_router,
-                    prefix=f"/confluence"
-                )
-                logger.info("Confluence router registered")
-                
-            elif service_name == "jira" and settings.jira:
-                from .mcps.jira.router import router as jira_router
-                app.include_router(
-                    jira_router,
-                    prefix=f"/jira"
-                )
-                logger.info("JIRA router registered")
-                
-            elif service_name == "slack" and settings.slack:
-                from .mcps.slack.router import router as slack_router
-                app.include_router(
-                    slack_router,
-                    prefix=f"/slack"
-                )
-                logger.info("Slack router registered")
-                
-            elif service_name == "calculator":
-                from .mcps.calculator.router import router as calculator_router
-                app.include_router(
-                    calculator_router,
-                    prefix=f"/calculator"
-                )
-                logger.info("Calculator router registered")
+            router = _import_attr(f"{spec.router_module}:router")
+            app.include_router(router, prefix=f"/{service_name}")
+            logger.info(f"{spec.display_name} router registered")
                 
         except ImportError as e:
             logger.warning(f"Could not import {service_name} router", error=str(e))
@@ -1,6 +1,6 @@
 """Calculator MCP 클라이언트 (로컬 계산용)"""
 
-import asyncio
+import time
 from typing import Optional, Dict, Any
 import structlog
 
@@ -21,7 +21,7 @@ class CalculatorClient:
         return {
             "status": "healthy",
             "service": "calculator",
-            "timestamp": asyncio.get_event_loop().time(),
+            "timestamp": time.monotonic(),
             "config_valid": self.config.validate_config()
         }
     
@@ -48,18 +48,12 @@ class CalculatorClient:
         }
 
 
-# 전역 클라이언트 인스턴스
-_calculator_client: Optional[CalculatorClient] = None
+# 전역 클라이언트 인스턴스 (외부 연결이 없으므로 모듈 로드 시 생성)
+_calculator_client: CalculatorClient = CalculatorClient()
 
 
 def get_calculator_client() -> CalculatorClient:
     """계산기 클라이언트 인스턴스 반환"""
-    global _calculator_client
-    
-    if _calculator_client is None:
-        _calculator_client = CalculatorClient()
-        logger.info("Calculator client initialized")
-    
     return _calculator_client
 
 
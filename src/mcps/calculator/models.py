@@ -1,11 +1,35 @@
 """Calculator MCP 모델들"""
 
-from typing import List, Union
-from pydantic import BaseModel, Field, field_validator
+import math
+from typing import ClassVar, FrozenSet, List, Union
+from pydantic import BaseModel, Field, field_serializer, field_validator, model_validator
+from datetime import datetime
 from enum import Enum
 
 from ...shared.models import BaseResponseModel
 
+# 수식에서 허용된 문자들 (허용 문자를 제거한 뒤 남는 문자가 있으면 거부)
+ALLOWED_EXPRESSION_CHARS = frozenset("0123456789+-*/()., ")
+_STRIP_ALLOWED_TABLE = str.maketrans("", "", "".join(ALLOWED_EXPRESSION_CHARS))
+
+
+def has_only_allowed_chars(expression: str) -> bool:
+    """수식이 허용된 문자만 포함하는지 확인"""
+    return not expression.translate(_STRIP_ALLOWED_TABLE)
+
+
+def _parentheses_balanced(expression: str) -> bool:
+    """괄호 균형 확인 (한 번의 순회로 깊이 추적)"""
+    depth = 0
+    for c in expression:
+        if c == "(":
+            depth += 1
+        elif c == ")":
+            depth -= 1
+            if depth < 0:
+                return False
+    return depth == 0
+
 
 class CalculatorOperation(str, Enum):
     """계산기 연산 타입"""
@@ -25,13 +49,18 @@ class BasicCalculationRequest(BaseModel):
     b: float = Field(..., description="두 번째 수")
     operation: CalculatorOperation = Field(..., description="수행할 연산")
     
-    @field_validator("b")
-    @classmethod
-    def validate_division_by_zero(cls, v, info):
+    _ZERO_DIVISION_OPS: ClassVar[FrozenSet[CalculatorOperation]] = frozenset({
+        CalculatorOperation.DIVIDE,
+        CalculatorOperation.MODULO,
+    })
+    
+    @model_validator(mode="after")
+    def validate_division_by_zero(self):
         # 나눗셈이나 모듈로 연산에서 0으로 나누는 것 방지
-        if hasattr(info, 'data') and info.data.get('operation') in ['divide', 'modulo'] and v == 0:
+        # (operation 필드는 b 이후에 검증되므로 모델 단위로 확인)
+        if self.b == 0 and self.operation in self._ZERO_DIVISION_OPS:
             raise ValueError("0으로 나눌 수 없습니다")
-        return v
+        return self
 
 
 class SingleNumberRequest(BaseModel):
@@ -59,10 +88,9 @@ class MultiNumberRequest(BaseModel):
     def validate_numbers(cls, v):
         if not v:
             raise ValueError("최소 하나의 숫자가 필요합니다")
-        # 매우 큰 수나 작은 수 제한
-        for num in v:
-            if abs(num) > 1e15:
-                raise ValueError("너무 큰 수는 계산할 수 없습니다")
+        # 매우 큰 수나 작은 수 제한 (C 레벨 max/map으로 한 번에 확인)
+        if max(map(abs, v)) > 1e15:
+            raise ValueError("너무 큰 수는 계산할 수 없습니다")
         return v
 
 
@@ -78,12 +106,11 @@ class ExpressionRequest(BaseModel):
             raise ValueError("수식은 비어있을 수 없습니다")
         
         # 허용된 문자만 포함하는지 확인 (보안을 위해)
-        allowed_chars = set("0123456789+-*/()., ")
-        if not all(c in allowed_chars for c in v):
+        if not has_only_allowed_chars(v):
             raise ValueError("수식에 허용되지 않은 문자가 포함되어 있습니다")
         
         # 괄호 균형 확인
-        if v.count('(') != v.count(')'):
+        if not _parentheses_balanced(v):
             raise ValueError("괄호가 맞지 않습니다")
         
         return v.strip()
@@ -102,9 +129,14 @@ class CalculationResult(BaseModel):
     @classmethod
     def validate_result(cls, v):
         # NaN이나 무한대 체크
-        if str(v).lower() in ['nan', 'inf', '-inf']:
+        if not math.isfinite(v):
             raise ValueError("유효하지 않은 계산 결과입니다")
         return v
+    
+    @field_serializer("result")
+    def serialize_result(self, v: float) -> float:
+        # 표시 정밀도 반올림은 응답 직렬화 시점에만 적용
+        return round(v, self.precision)
 
 
 class CalculationHistory(BaseModel):
@@ -113,7 +145,12 @@ class CalculationHistory(BaseModel):
     operation: str = Field(description="수행된 연산")
     input_values: Union[List[float], str] = Field(description="입력 값들")
     result: float = Field(description="계산 결과")
-    timestamp: str = Field(description="계산 시간")
+    timestamp: float = Field(description="계산 시간 (epoch 초)")
+    
+    @field_serializer("timestamp")
+    def serialize_timestamp(self, v: float) -> str:
+        # 조회 시점에만 ISO 문자열로 변환
+        return datetime.fromtimestamp(v).isoformat()
 
 
 class CalculatorStats(BaseModel):
@@ -1,14 +1,19 @@
 """Calculator MCP 라우터"""
 
+import ast
 import math
+import operator
 import time
-from typing import Dict, Any, Optional, List
-from fastapi import APIRouter, Depends, HTTPException, Query
+from collections import deque
+from itertools import islice
+from functools import lru_cache
+from types import CodeType
+from typing import Dict, Any, Optional
+from fastapi import APIRouter, BackgroundTasks, Depends, Query
 import structlog
-from datetime import datetime
 
-from ...shared.utils import format_error_response, create_success_response
-from ...shared.exceptions import MCPBaseException
+from ...shared.utils import FastJSONResponse, create_success_response
+from ...shared.exceptions import CalculationError
 from ...shared.auth import get_optional_user
 from .config import calculator_config
 from .models import (
@@ -22,95 +27,131 @@ from .models import (
     StatsResponse,
     CalculationResult,
     CalculationHistory,
+    CalculatorOperation,
     CalculatorStats,
     CalculatorErrorDetail
 )
 
 logger = structlog.get_logger(__name__)
 
-router = APIRouter(tags=["calculator"])
+router = APIRouter(tags=["calculator"], default_response_class=FastJSONResponse)
+
+# 설정값은 초기화 이후 변하지 않으므로 모듈 로드 시 한 번만 읽음
+_MAX_PRECISION = calculator_config.max_precision
+_MAX_NUMBER_SIZE = calculator_config.max_number_size
+_MAX_HISTORY_SIZE = calculator_config.max_history_size
+_ENABLE_HISTORY = calculator_config.enable_history
+_ENABLE_STATS = calculator_config.enable_stats
 
 # 간단한 인메모리 저장소 (실제 환경에서는 Redis나 DB 사용)
-calculation_history: List[CalculationHistory] = []
+calculation_history: deque[CalculationHistory] = deque(maxlen=_MAX_HISTORY_SIZE)
 calculation_stats = {
-    "total": 0,
     "successful": 0,
     "failed": 0,
-    "operations": {},
-    "total_time": 0.0
+    "total_time_ns": 0
 }
 
+# 연산별 사용 횟수 (연산 이름 → 인덱스, 고정 길이 카운터 배열)
+_OP_NAMES = [op.value for op in CalculatorOperation] + ["expression"]
+_OP_INDEX = {name: i for i, name in enumerate(_OP_NAMES)}
+_op_counts = [0] * len(_OP_NAMES)
+
 
-def _add_to_history(operation: str, input_values, result: float):
+def _add_to_history(operation: str, input_values, result: float, timestamp: float):
     """계산 기록 추가"""
-    if not calculator_config.enable_history:
+    if not _ENABLE_HISTORY:
         return
     
     history_item = CalculationHistory(
         operation=operation,
         input_values=input_values,
         result=result,
-        timestamp=datetime.now().isoformat()
+        timestamp=timestamp
     )
     
+    # maxlen 초과 시 가장 오래된 기록이 자동으로 제거됨
     calculation_history.append(history_item)
-    
-    # 최대 기록 수 제한
-    if len(calculation_history) > calculator_config.max_history_size:
-        calculation_history.pop(0)
 
 
-def _update_stats(operation: str, success: bool, execution_time: float):
-    """통계 업데이트"""
-    if not calculator_config.enable_stats:
+def _update_stats(operation: str, success: bool, elapsed_ns: int):
+    """통계 업데이트 (실행 시간은 ns 정수로 누적)"""
+    if not _ENABLE_STATS:
         return
     
-    calculation_stats["total"] += 1
     if success:
         calculation_stats["successful"] += 1
     else:
         calculation_stats["failed"] += 1
     
-    if operation not in calculation_stats["operations"]:
-        calculation_stats["operations"][operation] = 0
-    calculation_stats["operations"][operation] += 1
-    
-    calculation_stats["total_time"] += execution_time
+    _op_counts[_OP_INDEX[operation]] += 1
+    calculation_stats["total_time_ns"] += elapsed_ns
+
+
+def _record_success(operation: str, input_values, result: float, timestamp: float, elapsed_ns: int):
+    """성공한 계산의 기록/통계 반영 (응답 전송 후 백그라운드에서 실행)"""
+    _add_to_history(operation, input_values, result, timestamp)
+    _update_stats(operation, True, elapsed_ns)
+
+
+# 연산 이름 → C 구현 연산자 함수
+_BINARY_OPERATIONS = {
+    "add": operator.add,
+    "subtract": operator.sub,
+    "multiply": operator.mul,
+    "divide": operator.truediv,
+    "power": operator.pow,
+    "modulo": operator.mod,
+}
+_DIVISION_OPERATIONS = frozenset({"divide", "modulo"})
 
 
 def _perform_basic_calculation(a: float, b: float, operation: str) -> float:
     """기본 이항 연산 수행"""
-    if operation == "add":
-        return a + b
-    elif operation == "subtract":
-        return a - b
-    elif operation == "multiply":
-        return a * b
-    elif operation == "divide":
-        if b == 0:
-            raise ValueError("0으로 나눌 수 없습니다")
-        return a / b
-    elif operation == "power":
-        return pow(a, b)
-    elif operation == "modulo":
-        if b == 0:
-            raise ValueError("0으로 나눌 수 없습니다")
-        return a % b
-    else:
+    if b == 0 and operation in _DIVISION_OPERATIONS:
+        raise ValueError("0으로 나눌 수 없습니다")
+    
+    try:
+        operation_fn = _BINARY_OPERATIONS[operation]
+    except KeyError:
         raise ValueError(f"지원하지 않는 연산입니다: {operation}")
+    
+    return operation_fn(a, b)
+
+
+class _SafeExpressionValidator(ast.NodeVisitor):
+    """수식 AST 검증기 (사칙연산 관련 노드만 허용)"""
+    
+    ALLOWED_NODES = (
+        ast.Expression, ast.BinOp, ast.UnaryOp, ast.Constant,
+        ast.Add, ast.Sub, ast.Mult, ast.Div, ast.FloorDiv, ast.Mod, ast.Pow,
+        ast.UAdd, ast.USub,
+    )
+    
+    def generic_visit(self, node: ast.AST) -> None:
+        if not isinstance(node, self.ALLOWED_NODES):
+            raise ValueError("유효하지 않은 수식입니다")
+        if isinstance(node, ast.Constant) and not isinstance(node.value, (int, float)):
+            raise ValueError("유효하지 않은 수식입니다")
+        super().generic_visit(node)
+
+
+@lru_cache(maxsize=1024)
+def _compile_expression(expression: str) -> CodeType:
+    """수식을 검증 후 컴파일 (수식별로 캐시)"""
+    tree = ast.parse(expression, mode="eval")
+    _SafeExpressionValidator().visit(tree)
+    return compile(tree, "<calc>", "eval")
 
 
 def _safe_eval_expression(expression: str) -> float:
-    """안전한 수식 계산"""
-    # 보안을 위해 허용된 문자만 포함하는지 재확인
-    allowed_chars = set(calculator_config.get_allowed_expression_chars())
-    if not all(c in allowed_chars for c in expression):
-        raise ValueError("수식에 허용되지 않은 문자가 포함되어 있습니다")
+    """안전한 수식 계산
     
+    문자 검증은 ExpressionRequest 검증기에서 이미 수행되므로 여기서는 반복하지 않습니다.
+    허용되지 않은 구문은 AST 검증 단계에서 거부됩니다.
+    """
     try:
-        # eval 대신 안전한 방법으로 계산 (간단한 경우만)
-        # 실제로는 더 안전한 파서를 사용해야 함
-        result = eval(expression, {"__builtins__": {}}, {})
+        # AST 검증을 통과한 수식만 컴파일된 코드로 계산
+        result = eval(_compile_expression(expression), {"__builtins__": {}}, {})
         if not isinstance(result, (int, float)):
             raise ValueError("유효하지 않은 수식입니다")
         return float(result)
@@ -118,6 +159,31 @@ def _safe_eval_expression(expression: str) -> float:
         raise ValueError(f"수식 계산 중 오류: {str(e)}")
 
 
+def _compute(operation: str, start_ns: int, fn, *args, max_size: float = _MAX_NUMBER_SIZE, **details) -> float:
+    """계산 수행 및 결과 검증
+    
+    실패 시 통계를 반영하고 CalculationError를 발생시키며, 응답 변환과 로깅은
+    앱 전역 MCPBaseException 처리기가 담당합니다.
+    """
+    try:
+        result = fn(*args)
+        if not math.isfinite(result):
+            raise ValueError("유효하지 않은 계산 결과입니다")
+        if abs(result) > max_size:
+            raise ValueError("계산 결과가 너무 큽니다")
+        return result
+    except (ArithmeticError, TypeError, ValueError) as e:
+        _update_stats(operation, False, time.perf_counter_ns() - start_ns)
+        raise CalculationError(str(e), service="calculator", operation=operation, details=details) from e
+
+
+def _square_root(number: float) -> float:
+    """제곱근 계산"""
+    if number < 0:
+        raise ValueError("음수의 제곱근은 계산할 수 없습니다")
+    return math.sqrt(number)
+
+
 @router.post("/calculate", 
             response_model=BasicCalculationResponse,
             operation_id="calculator_basic_calculation",
@@ -125,67 +191,46 @@ def _safe_eval_expression(expression: str) -> float:
             description="두 숫자로 기본적인 수학 연산을 수행합니다")
 async def basic_calculation(
     request: BasicCalculationRequest,
+    background_tasks: BackgroundTasks,
     user: Optional[Dict[str, Any]] = Depends(get_optional_user)
 ):
     """기본 계산 수행"""
     
-    start_time = time.time()
+    start_ns = time.perf_counter_ns()
     operation = request.operation.value
     
-    try:
-        logger.info(
-            "Basic calculation requested",
-            a=request.a,
-            b=request.b,
-            operation=operation,
-            user_id=user.get("sub") if user else None
-        )
-        
-        result = _perform_basic_calculation(request.a, request.b, operation)
-        
-        # 결과 검증
-        if abs(result) > calculator_config.max_number_size:
-            raise ValueError("계산 결과가 너무 큽니다")
-        
-        calculation_result = CalculationResult(
-            result=round(result, calculator_config.max_precision),
-            operation=f"{request.a} {operation} {request.b}",
-            input_values=[request.a, request.b],
-            is_valid=True,
-            precision=calculator_config.max_precision
-        )
-        
-        execution_time = (time.time() - start_time) * 1000
-        _add_to_history(operation, [request.a, request.b], result)
-        _update_stats(operation, True, execution_time)
-        
-        logger.info(
-            "Basic calculation completed",
-            result=result,
-            execution_time_ms=execution_time
-        )
-        
-        return create_success_response(calculation_result)
-        
-    except Exception as e:
-        execution_time = (time.time() - start_time) * 1000
-        _update_stats(operation, False, execution_time)
-        
-        logger.error(
-            "Basic calculation failed",
-            error=str(e),
-            a=request.a,
-            b=request.b,
-            operation=operation
-        )
-        
-        raise HTTPException(
-            status_code=400,
-            detail=format_error_response(
-                message=str(e),
-                error_type="CalculationError"
-            )
-        )
+    logger.debug(
+        "Basic calculation requested",
+        a=request.a,
+        b=request.b,
+        operation=operation,
+        user_id=user.get("sub") if user else None
+    )
+    
+    # 결과 검증까지 마친 값은 model_construct로 재검증 없이 응답 생성
+    result = _compute(
+        operation, start_ns, _perform_basic_calculation, request.a, request.b, operation,
+        a=request.a, b=request.b
+    )
+    
+    calculation_result = CalculationResult.model_construct(
+        result=result,
+        operation=f"{request.a} {operation} {request.b}",
+        input_values=[request.a, request.b],
+        is_valid=True,
+        precision=_MAX_PRECISION
+    )
+    
+    elapsed_ns = time.perf_counter_ns() - start_ns
+    background_tasks.add_task(_record_success, operation, [request.a, request.b], result, time.time(), elapsed_ns)
+    
+    logger.debug(
+        "Basic calculation completed",
+        result=result,
+        execution_time_ms=elapsed_ns / 1_000_000
+    )
+    
+    return create_success_response(calculation_result)
 
 
 @router.post("/sqrt", 
@@ -195,56 +240,37 @@ async def basic_calculation(
             description="숫자의 제곱근을 계산합니다")
 async def square_root(
     request: SingleNumberRequest,
+    background_tasks: BackgroundTasks,
     user: Optional[Dict[str, Any]] = Depends(get_optional_user)
 ):
     """제곱근 계산"""
     
-    start_time = time.time()
+    start_ns = time.perf_counter_ns()
     operation = "sqrt"
     
-    try:
-        logger.info(
-            "Square root calculation requested",
-            number=request.number,
-            user_id=user.get("sub") if user else None
-        )
-        
-        if request.number < 0:
-            raise ValueError("음수의 제곱근은 계산할 수 없습니다")
-        
-        result = math.sqrt(request.number)
-        
-        calculation_result = CalculationResult(
-            result=round(result, calculator_config.max_precision),
-            operation=f"√{request.number}",
-            input_values=[request.number],
-            is_valid=True,
-            precision=calculator_config.max_precision
-        )
-        
-        execution_time = (time.time() - start_time) * 1000
-        _add_to_history(operation, [request.number], result)
-        _update_stats(operation, True, execution_time)
-        
-        return create_success_response(calculation_result)
-        
-    except Exception as e:
-        execution_time = (time.time() - start_time) * 1000
-        _update_stats(operation, False, execution_time)
-        
-        logger.error(
-            "Square root calculation failed",
-            error=str(e),
-            number=request.number
-        )
-        
-        raise HTTPException(
-            status_code=400,
-            detail=format_error_response(
-                message=str(e),
-                error_type="CalculationError"
-            )
-        )
+    logger.debug(
+        "Square root calculation requested",
+        number=request.number,
+        user_id=user.get("sub") if user else None
+    )
+    
+    result = _compute(
+        operation, start_ns, _square_root, request.number,
+        max_size=math.inf, number=request.number
+    )
+    
+    calculation_result = CalculationResult.model_construct(
+        result=result,
+        operation=f"√{request.number}",
+        input_values=[request.number],
+        is_valid=True,
+        precision=_MAX_PRECISION
+    )
+    
+    elapsed_ns = time.perf_counter_ns() - start_ns
+    background_tasks.add_task(_record_success, operation, [request.number], result, time.time(), elapsed_ns)
+    
+    return create_success_response(calculation_result)
 
 
 @router.post("/expression", 
@@ -254,56 +280,37 @@ async def square_root(
             description="수학 수식을 계산합니다")
 async def evaluate_expression(
     request: ExpressionRequest,
+    background_tasks: BackgroundTasks,
     user: Optional[Dict[str, Any]] = Depends(get_optional_user)
 ):
     """수식 계산"""
     
-    start_time = time.time()
+    start_ns = time.perf_counter_ns()
     operation = "expression"
     
-    try:
-        logger.info(
-            "Expression evaluation requested",
-            expression=request.expression,
-            user_id=user.get("sub") if user else None
-        )
-        
-        result = _safe_eval_expression(request.expression)
-        
-        if abs(result) > calculator_config.max_number_size:
-            raise ValueError("계산 결과가 너무 큽니다")
-        
-        calculation_result = CalculationResult(
-            result=round(result, calculator_config.max_precision),
-            operation=request.expression,
-            input_values=request.expression,
-            is_valid=True,
-            precision=calculator_config.max_precision
-        )
-        
-        execution_time = (time.time() - start_time) * 1000
-        _add_to_history(operation, request.expression, result)
-        _update_stats(operation, True, execution_time)
-        
-        return create_success_response(calculation_result)
-        
-    except Exception as e:
-        execution_time = (time.time() - start_time) * 1000
-        _update_stats(operation, False, execution_time)
-        
-        logger.error(
-            "Expression evaluation failed",
-            error=str(e),
-            expression=request.expression
-        )
-        
-        raise HTTPException(
-            status_code=400,
-            detail=format_error_response(
-                message=str(e),
-                error_type="ExpressionError"
-            )
-        )
+    logger.debug(
+        "Expression evaluation requested",
+        expression=request.expression,
+        user_id=user.get("sub") if user else None
+    )
+    
+    result = _compute(
+        operation, start_ns, _safe_eval_expression, request.expression,
+        expression=request.expression
+    )
+    
+    calculation_result = CalculationResult.model_construct(
+        result=result,
+        operation=request.expression,
+        input_values=request.expression,
+        is_valid=True,
+        precision=_MAX_PRECISION
+    )
+    
+    elapsed_ns = time.perf_counter_ns() - start_ns
+    background_tasks.add_task(_record_success, operation, request.expression, result, time.time(), elapsed_ns)
+    
+    return create_success_response(calculation_result)
 
 
 @router.get("/history", 
@@ -317,32 +324,16 @@ async def get_calculation_history(
 ):
     """계산 기록 조회"""
     
-    try:
-        logger.info(
-            "Calculation history requested",
-            limit=limit,
-            user_id=user.get("sub") if user else None
-        )
-        
-        # 최신 기록부터 반환
-        recent_history = calculation_history[-limit:] if len(calculation_history) >= limit else calculation_history
-        recent_history.reverse()
-        
-        return create_success_response(recent_history)
-        
-    except Exception as e:
-        logger.error(
-            "Failed to get calculation history",
-            error=str(e)
-        )
-        
-        raise HTTPException(
-            status_code=500,
-            detail=format_error_response(
-                message="계산 기록을 가져오는 중 오류가 발생했습니다",
-                error_type="HistoryError"
-            )
-        )
+    logger.debug(
+        "Calculation history requested",
+        limit=limit,
+        user_id=user.get("sub") if user else None
+    )
+    
+    # 최신 기록부터 반환
+    recent_history = list(islice(reversed(calculation_history), limit))
+    
+    return create_success_response(recent_history)
 
 
 @router.get("/stats", 
@@ -355,48 +346,33 @@ async def get_calculator_stats(
 ):
     """계산기 통계 조회"""
     
-    try:
-        logger.info(
-            "Calculator stats requested",
-            user_id=user.get("sub") if user else None
-        )
-        
-        # 가장 많이 사용된 연산 찾기
-        most_used_operation = "없음"
-        if calculation_stats["operations"]:
-            most_used_operation = max(
-                calculation_stats["operations"].items(),
-                key=lambda x: x[1]
-            )[0]
-        
-        # 평균 계산 시간
-        avg_time = 0.0
-        if calculation_stats["total"] > 0:
-            avg_time = calculation_stats["total_time"] / calculation_stats["total"]
-        
-        stats = CalculatorStats(
-            total_calculations=calculation_stats["total"],
-            successful_calculations=calculation_stats["successful"],
-            failed_calculations=calculation_stats["failed"],
-            most_used_operation=most_used_operation,
-            average_calculation_time=round(avg_time, 2)
-        )
-        
-        return create_success_response(stats)
-        
-    except Exception as e:
-        logger.error(
-            "Failed to get calculator stats",
-            error=str(e)
-        )
-        
-        raise HTTPException(
-            status_code=500,
-            detail=format_error_response(
-                message="통계를 가져오는 중 오류가 발생했습니다",
-                error_type="StatsError"
-            )
-        )
+    logger.debug(
+        "Calculator stats requested",
+        user_id=user.get("sub") if user else None
+    )
+    
+    # 총 계산 수는 조회 시점에 집계
+    total = calculation_stats["successful"] + calculation_stats["failed"]
+    
+    # 가장 많이 사용된 연산 찾기
+    most_used_operation = "없음"
+    if total > 0:
+        most_used_operation = _OP_NAMES[max(range(len(_op_counts)), key=_op_counts.__getitem__)]
+    
+    # 평균 계산 시간 (ms 변환은 조회 시점에 수행)
+    avg_time = 0.0
+    if total > 0:
+        avg_time = calculation_stats["total_time_ns"] / total / 1_000_000
+    
+    stats = CalculatorStats(
+        total_calculations=total,
+        successful_calculations=calculation_stats["successful"],
+        failed_calculations=calculation_stats["failed"],
+        most_used_operation=most_used_operation,
+        average_calculation_time=round(avg_time, 2)
+    )
+    
+    return create_success_response(stats)
 
 
 @router.delete("/history", 
@@ -408,26 +384,11 @@ async def clear_calculation_history(
 ):
     """계산 기록 삭제"""
     
-    try:
-        logger.info(
-            "Clear calculation history requested",
-            user_id=user.get("sub") if user else None
-        )
-        
-        calculation_history.clear()
-        
-        return create_success_response({"message": "계산 기록이 삭제되었습니다"})
-        
-    except Exception as e:
-        logger.error(
-            "Failed to clear calculation history",
-            error=str(e)
-        )
-        
-        raise HTTPException(
-            status_code=500,
-            detail=format_error_response(
-                message="기록 삭제 중 오류가 발생했습니다",
-                error_type="HistoryError"
-            )
-        )
\ No newline at end of file
+    logger.info(
+        "Clear calculation history requested",
+        user_id=user.get("sub") if user else None
+    )
+    
+    calculation_history.clear()
+    
+    return create_success_response({"message": "계산 기록이 삭제되었습니다"})
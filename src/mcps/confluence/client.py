@@ -1,12 +1,18 @@
 """Confluence API 클라이언트"""
 
 import asyncio
-from typing import Dict, Any, Optional, List
+import itertools
+import time
+from typing import Any, Dict, List, NoReturn, Optional, Tuple, Type, TypeVar
 import httpx
 import structlog
+from pydantic import BaseModel
 
-from ...shared.utils import retry_with_backoff, measure_time
-from ...shared.exceptions import ExternalAPIError, AuthenticationError, RateLimitError
+from ...shared.cache import SingleFlight, TTLCache
+from ...shared.utils import StatusErrorTable, json_loads, normalize_query, raise_for_status_error, retry_with_backoff
+from ...shared.stats import RequestCounters
+from ...shared.exceptions import ExternalAPIError, AuthenticationError, MCPBaseException, RateLimitError
+from ...shared.http import get_http_client
 from .config import confluence_config
 from .models import (
     ConfluenceSearchResult, 
@@ -17,22 +23,104 @@ from .models import (
 
 logger = structlog.get_logger(__name__)
 
+# 캐시 키 정규화 시 대소문자를 통일하는 CQL 예약어
+_CQL_CASE_INSENSITIVE_KEYWORDS = frozenset({"and", "or", "not", "in", "order", "by", "asc", "desc"})
+
+# 모든 작업에 공통인 상태 코드 매핑
+_COMMON_STATUS_ERRORS: StatusErrorTable = {
+    401: (AuthenticationError, "Confluence 인증 실패", "error"),
+    429: (RateLimitError, "Confluence 레이트 리미트 초과", "warning"),
+}
+# 작업별 상태 코드 → (예외 클래스, 메시지 템플릿, 로그 레벨)
+_STATUS_ERRORS: Dict[str, StatusErrorTable] = {
+    "search": {
+        **_COMMON_STATUS_ERRORS,
+        403: (AuthenticationError, "Confluence 접근 권한 없음", "error"),
+    },
+    "get_page": {
+        **_COMMON_STATUS_ERRORS,
+        403: (AuthenticationError, "페이지 접근 권한 없음", "error"),
+        404: (ExternalAPIError, "페이지를 찾을 수 없습니다: {target}", "warning"),
+    },
+    "get_space": {
+        **_COMMON_STATUS_ERRORS,
+        403: (AuthenticationError, "스페이스 접근 권한 없음", "error"),
+        404: (ExternalAPIError, "스페이스를 찾을 수 없습니다: {target}", "warning"),
+    },
+}
+# 작업별 오류 메시지 접두어
+_OPERATION_LABELS = {
+    "search": "Confluence 검색",
+    "get_page": "페이지 조회",
+    "get_space": "스페이스 조회",
+}
+
+
+def _raise_for_status(error: httpx.HTTPStatusError, operation: str, target: Optional[str] = None) -> NoReturn:
+    """HTTP 상태 오류를 작업별 MCP 예외로 변환"""
+    raise_for_status_error(
+        error, _STATUS_ERRORS[operation], _OPERATION_LABELS[operation], "confluence", operation, target
+    )
+
+
+def _page_batch_error(error: Exception, target: str) -> MCPBaseException:
+    """배치 페이지 조회 오류를 대기 중인 모든 요청에 전달할 MCP 예외로 변환"""
+    if isinstance(error, httpx.HTTPStatusError):
+        try:
+            _raise_for_status(error, "get_page", target)
+        except MCPBaseException as mapped:
+            return mapped
+    
+    if isinstance(error, MCPBaseException):
+        return error
+    
+    logger.error("Confluence page batch retrieval error", target=target, error=str(error))
+    return ExternalAPIError(
+        f"{_OPERATION_LABELS['get_page']} 오류: {str(error)}",
+        service="confluence",
+        operation="get_page"
+    )
+
+
+# httpx에 그대로 전달하는 쿼리 파라미터 ((키, 값) 쌍 튜플)
+_QueryParams = Optional[Tuple[Tuple[str, Any], ...]]
+_ModelT = TypeVar("_ModelT", bound=BaseModel)
+
 
 class ConfluenceClient:
     """Confluence API 클라이언트"""
     
-    def __init__(self):
+    def __init__(self, http_client: Optional[httpx.AsyncClient] = None):
         if not confluence_config:
             raise ValueError("Confluence 설정이 초기화되지 않았습니다")
         
         self.config = confluence_config
+        # 주입받은 HTTP 클라이언트 (없으면 프로세스 공용 연결 풀 사용, 종료는 소유자에게 맡김)
+        self._http_client = http_client
         self.client: Optional[httpx.AsyncClient] = None
-        self.stats = ConfluenceStats(
-            total_requests=0,
-            successful_requests=0,
-            failed_requests=0,
-            average_response_time=0.0
-        )
+        self._request_kwargs = {
+            "auth": self.config.auth_tuple,
+            "headers": self.config.headers,
+            "timeout": self.config.timeout
+        }
+        self._retry_kwargs = {
+            "max_retries": self.config.max_retries,
+            "base_delay": self.config.retry_base_delay,
+            "max_delay": self.config.retry_max_delay,
+            "jitter": self.config.retry_jitter
+        }
+        # 조회 응답 TTL 캐시
+        self._cache = TTLCache(self.config.cache_max_size)
+        # 진행 중인 요청 병합 (키 → 업스트림 호출 태스크)
+        self._inflight = SingleFlight()
+        # 묶어서 조회할 대기 중 페이지 (expand → 페이지 ID → 결과 Future)
+        self._page_batches: Dict[str, Dict[str, asyncio.Future]] = {}
+        self._batch_tasks: set = set()
+        # 평균 응답 시간은 지수 이동 평균
+        self._counters = RequestCounters(ema_alpha=0.1)
+        # 배치 크기별 실행 횟수
+        self._batch_sizes: Dict[int, int] = {}
+        self._completion_log_counter = itertools.count()
     
     async def __aenter__(self):
         """비동기 컨텍스트 매니저 시작"""
@@ -46,223 +134,284 @@ class ConfluenceClient:
     async def connect(self):
         """HTTP 클라이언트 연결"""
         if self.client is None:
-            self.client = httpx.AsyncClient(
-                auth=self.config.auth_tuple,
-                timeout=httpx.Timeout(self.config.timeout),
-                headers=self.config.headers,
-                limits=httpx.Limits(max_keepalive_connections=5, max_connections=10)
-            )
+            # 공용 클라이언트가 종료 후 재생성되었을 수 있으므로 연결할 때마다 새로 조회
+            self.client = self._http_client if self._http_client is not None else get_http_client()
             logger.info("Confluence client connected", base_url=self.config.base_url)
     
     async def close(self):
-        """HTTP 클라이언트 종료"""
+        """HTTP 클라이언트 연결 해제 (공용/주입 클라이언트는 닫지 않음)"""
         if self.client:
-            await self.client.aclose()
             self.client = None
             logger.info("Confluence client disconnected")
     
-    @measure_time
     async def search(
         self, 
         cql: str, 
         limit: int = 25, 
         cursor: Optional[str] = None,
-        expand: Optional[str] = None
+        expand: Optional[str] = None,
+        no_cache: bool = False
     ) -> ConfluenceSearchResult:
         """CQL을 사용한 콘텐츠 검색"""
         
-        if not self.client:
-            await self.connect()
-        
-        params = {
-            "cql": cql,
-            "limit": min(limit, self.config.max_results)
-        }
+        # 순서가 고정된 (키, 값) 쌍으로 구성하여 그대로 캐시 키에 사용
+        options: List[Tuple[str, Any]] = [("limit", min(limit, self.config.max_results))]
         
         if cursor:
-            params["cursor"] = cursor
+            options.append(("cursor", cursor))
         
         if expand:
-            params["expand"] = expand
+            options.append(("expand", expand))
         
-        try:
-            logger.info("Confluence search started", cql=cql, limit=limit)
-            
-            response = await retry_with_backoff(
-                self.client,
-                "GET",
-                self.config.get_search_url(),
-                params=params,
-                max_retries=self.config.max_retries
-            )
-            
-            self._update_stats(success=True, response_time=response.elapsed.total_seconds())
-            
-            data = response.json()
-            logger.info("Confluence search completed", results_count=data.get("size", 0))
-            
-            return ConfluenceSearchResult(**data)
-            
-        except httpx.HTTPStatusError as e:
-            self._update_stats(success=False)
-            
-            if e.response.status_code == 401:
-                logger.error("Confluence authentication failed")
-                raise AuthenticationError("Confluence 인증 실패", service="confluence", operation="search")
-            elif e.response.status_code == 403:
-                logger.error("Confluence access forbidden")
-                raise AuthenticationError("Confluence 접근 권한 없음", service="confluence", operation="search")
-            elif e.response.status_code == 429:
-                logger.warning("Confluence rate limit exceeded")
-                raise RateLimitError("Confluence 레이트 리미트 초과", service="confluence", operation="search")
-            else:
-                logger.error("Confluence search failed", status_code=e.response.status_code, error=str(e))
-                raise ExternalAPIError(
-                    f"Confluence 검색 실패: {e.response.status_code}",
-                    status_code=e.response.status_code,
-                    service="confluence",
-                    operation="search"
-                )
+        params = (("cql", cql), *options)
         
-        except Exception as e:
-            self._update_stats(success=False)
-            logger.error("Confluence search error", error=str(e))
-            raise ExternalAPIError(f"Confluence 검색 오류: {str(e)}", service="confluence", operation="search")
+        # 표기만 다른 동일 쿼리가 같은 캐시 항목을 사용하도록 정규화된 CQL로 키 생성
+        cache_key = ("search", normalize_query(cql, _CQL_CASE_INSENSITIVE_KEYWORDS), tuple(options))
+        if not no_cache:
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                return cached
+        
+        # 동일한 요청이 진행 중이면 새로 호출하지 않고 그 결과를 공유
+        return await self._inflight.do(
+            cache_key,
+            lambda: self._request(self.config.get_search_url(), params, ConfluenceSearchResult, "search", cache_key, cql)
+        )
     
-    @measure_time
     async def get_page(
         self, 
         page_id: str, 
-        expand: str = "body.storage,version"
+        expand: str = "body.storage,version",
+        no_cache: bool = False
     ) -> ConfluenceContent:
         """페이지 상세 정보 조회"""
         
-        if not self.client:
-            await self.connect()
+        params = (("expand", expand),)
+        
+        cache_key = ("page", page_id, expand)
+        if not no_cache:
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                return cached
+        
+        # 동일한 요청이 진행 중이면 새로 호출하지 않고 그 결과를 공유
+        return await self._inflight.do(
+            cache_key,
+            lambda: self._load_page(params, cache_key, page_id, expand)
+        )
+    
+    async def _load_page(
+        self,
+        params: _QueryParams,
+        cache_key: Tuple,
+        page_id: str,
+        expand: str
+    ) -> ConfluenceContent:
+        """페이지 로드 (숫자 ID는 짧은 시간 동안 모아 일괄 조회)"""
+        # CQL에 직접 들어가므로 숫자 ID만 배치 대상으로 허용
+        if self.config.batch_window > 0 and page_id.isdigit():
+            return await self._enqueue_page(page_id, expand)
+        return await self._request(
+            self.config.get_content_url(page_id), params, ConfluenceContent, "get_page", cache_key, page_id
+        )
+    
+    def _enqueue_page(self, page_id: str, expand: str) -> asyncio.Future:
+        """페이지 조회 요청을 배치에 추가"""
+        loop = asyncio.get_running_loop()
+        
+        batch = self._page_batches.get(expand)
+        if batch is None:
+            batch = self._page_batches[expand] = {}
+            loop.call_later(self.config.batch_window, self._dispatch_page_batch, expand, batch)
+        
+        future = batch.get(page_id)
+        if future is None:
+            future = batch[page_id] = loop.create_future()
+        
+        if len(batch) >= self.config.batch_max_size:
+            self._dispatch_page_batch(expand, batch)
         
-        params = {"expand": expand}
+        return future
+    
+    def _dispatch_page_batch(self, expand: str, batch: Dict[str, asyncio.Future]):
+        """모인 배치 실행 (크기 도달 또는 대기 시간 만료 시 한 번만)"""
+        if self._page_batches.get(expand) is not batch:
+            return
+        del self._page_batches[expand]
+        
+        task = asyncio.create_task(self._run_page_batch(expand, batch))
+        self._batch_tasks.add(task)
+        task.add_done_callback(self._batch_tasks.discard)
+    
+    async def _run_page_batch(self, expand: str, batch: Dict[str, asyncio.Future]):
+        """배치 실행 (대기자가 취소된 요청은 제외하고, 결과를 받지 못한 요청은 끝나지 않은 채 남기지 않음)"""
+        batch = {page_id: future for page_id, future in batch.items() if not future.done()}
+        if not batch:
+            return
         
         try:
-            logger.info("Confluence page retrieval started", page_id=page_id)
-            
-            response = await retry_with_backoff(
-                self.client,
-                "GET",
-                self.config.get_content_url(page_id),
-                params=params,
-                max_retries=self.config.max_retries
-            )
-            
-            self._update_stats(success=True, response_time=response.elapsed.total_seconds())
-            
-            data = response.json()
-            logger.info("Confluence page retrieved", page_id=page_id, title=data.get("title"))
-            
-            return ConfluenceContent(**data)
-            
-        except httpx.HTTPStatusError as e:
-            self._update_stats(success=False)
-            
-            if e.response.status_code == 404:
-                logger.warning("Confluence page not found", page_id=page_id)
-                raise ExternalAPIError(f"페이지를 찾을 수 없습니다: {page_id}", status_code=404, service="confluence", operation="get_page")
-            elif e.response.status_code == 401:
-                logger.error("Confluence authentication failed")
-                raise AuthenticationError("Confluence 인증 실패", service="confluence", operation="get_page")
-            elif e.response.status_code == 403:
-                logger.error("Confluence access forbidden", page_id=page_id)
-                raise AuthenticationError("페이지 접근 권한 없음", service="confluence", operation="get_page")
-            else:
-                logger.error("Confluence page retrieval failed", page_id=page_id, status_code=e.response.status_code)
-                raise ExternalAPIError(
-                    f"페이지 조회 실패: {e.response.status_code}",
-                    status_code=e.response.status_code,
-                    service="confluence",
-                    operation="get_page"
+            await self._fetch_page_batch(expand, batch)
+        finally:
+            # 배치 작업 자체가 취소된 경우에도 대기 중인 요청이 끝없이 기다리지 않도록 정리
+            for future in batch.values():
+                if not future.done():
+                    future.cancel()
+    
+    async def _fetch_page_batch(self, expand: str, batch: Dict[str, asyncio.Future]):
+        """배치 페이지 조회 후 요청별 Future에 결과 분배"""
+        histogram = self._batch_sizes
+        histogram[len(batch)] = histogram.get(len(batch), 0) + 1
+        
+        pages: Dict[str, ConfluenceContent] = {}
+        
+        # 배치가 1개면 CQL 없이 단일 페이지 API 사용
+        if len(batch) > 1:
+            try:
+                logger.debug("Confluence page batch retrieval started", batch_size=len(batch))
+                
+                start_ns = time.perf_counter_ns()
+                response = await retry_with_backoff(
+                    self.client,
+                    "GET",
+                    self.config.get_content_search_url(),
+                    params={
+                        "cql": f"id in ({','.join(batch)})",
+                        "expand": expand,
+                        "limit": len(batch)
+                    },
+                    **self._retry_kwargs,
+                    **self._request_kwargs
                 )
+                
+                response_ms = (time.perf_counter_ns() - start_ns) / 1e6
+                self._counters.record(success=True, response_ms=response_ms)
+                
+                for item in json_loads(response.content).get("results", []):
+                    page = ConfluenceContent.model_validate(item)
+                    pages[page.id] = page
+                    self._cache.set(("page", page.id, expand), page, self.config.cache_ttl)
+                    
+            except Exception as e:
+                # 배치 자체가 실패하면(429/401/403 등) 페이지별 재요청 없이 같은 오류를 모든 대기 요청에 전달
+                self._counters.record(success=False)
+                error = _page_batch_error(e, ",".join(batch))
+                for future in batch.values():
+                    if not future.done():
+                        future.set_exception(error)
+                return
         
-        except Exception as e:
-            self._update_stats(success=False)
-            logger.error("Confluence page retrieval error", page_id=page_id, error=str(e))
-            raise ExternalAPIError(f"페이지 조회 오류: {str(e)}", service="confluence", operation="get_page")
+        async def resolve(page_id: str, future: asyncio.Future):
+            # 배치 조회 중에 대기자가 취소되었으면 단일 조회를 생략
+            if future.done():
+                return
+            
+            # 성공한 배치 응답에 없는 페이지만 단일 조회로 정확한 오류(404/403 등)를 얻음
+            try:
+                page = pages.get(page_id)
+                if page is None:
+                    page = await self._request(
+                        self.config.get_content_url(page_id),
+                        (("expand", expand),),
+                        ConfluenceContent,
+                        "get_page",
+                        ("page", page_id, expand),
+                        page_id
+                    )
+                if not future.done():
+                    future.set_result(page)
+            except Exception as e:
+                if not future.done():
+                    future.set_exception(e)
+        
+        await asyncio.gather(*[resolve(page_id, future) for page_id, future in batch.items()])
     
-    @measure_time
     async def get_space(
         self, 
         space_key: str, 
-        expand: Optional[str] = None
+        expand: Optional[str] = None,
+        no_cache: bool = False
     ) -> ConfluenceSpace:
         """스페이스 정보 조회"""
         
-        if not self.client:
-            await self.connect()
+        params = (("expand", expand),) if expand else None
         
-        params = {}
-        if expand:
-            params["expand"] = expand
+        cache_key = ("space", space_key, expand)
+        if not no_cache:
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                return cached
+        
+        # 동일한 요청이 진행 중이면 새로 호출하지 않고 그 결과를 공유
+        return await self._inflight.do(
+            cache_key,
+            lambda: self._request(self.config.get_space_url(space_key), params, ConfluenceSpace, "get_space", cache_key, space_key)
+        )
+    
+    async def _request(
+        self,
+        url: str,
+        params: _QueryParams,
+        model_cls: Type[_ModelT],
+        operation: str,
+        cache_key: Tuple,
+        target: Optional[str] = None
+    ) -> _ModelT:
+        """GET 요청 실행 후 응답을 모델로 검증하여 캐시에 저장"""
         
         try:
-            logger.info("Confluence space retrieval started", space_key=space_key)
+            logger.debug("Confluence request started", operation=operation, target=target)
             
+            start_ns = time.perf_counter_ns()
             response = await retry_with_backoff(
                 self.client,
                 "GET",
-                self.config.get_space_url(space_key),
+                url,
                 params=params,
-                max_retries=self.config.max_retries
+                **self._retry_kwargs,
+                **self._request_kwargs
             )
             
-            self._update_stats(success=True, response_time=response.elapsed.total_seconds())
+            response_ms = (time.perf_counter_ns() - start_ns) / 1e6
+            self._counters.record(success=True, response_ms=response_ms)
             
-            data = response.json()
-            logger.info("Confluence space retrieved", space_key=space_key, name=data.get("name"))
+            # 큰 페이지 본문도 중간 dict 없이 응답 바이트에서 바로 모델로 검증
+            result = model_cls.model_validate_json(response.content)
+            if self._should_log_completion():
+                logger.info("Confluence request completed", operation=operation, target=target, duration_ms=response_ms)
             
-            return ConfluenceSpace(**data)
+            self._cache.set(cache_key, result, self.config.cache_ttl)
+            return result
             
         except httpx.HTTPStatusError as e:
-            self._update_stats(success=False)
-            
-            if e.response.status_code == 404:
-                logger.warning("Confluence space not found", space_key=space_key)
-                raise ExternalAPIError(f"스페이스를 찾을 수 없습니다: {space_key}", status_code=404, service="confluence", operation="get_space")
-            elif e.response.status_code == 401:
-                logger.error("Confluence authentication failed")
-                raise AuthenticationError("Confluence 인증 실패", service="confluence", operation="get_space")
-            elif e.response.status_code == 403:
-                logger.error("Confluence access forbidden", space_key=space_key)
-                raise AuthenticationError("스페이스 접근 권한 없음", service="confluence", operation="get_space")
-            else:
-                logger.error("Confluence space retrieval failed", space_key=space_key, status_code=e.response.status_code)
-                raise ExternalAPIError(
-                    f"스페이스 조회 실패: {e.response.status_code}",
-                    status_code=e.response.status_code,
-                    service="confluence",
-                    operation="get_space"
-                )
+            self._counters.record(success=False)
+            _raise_for_status(e, operation, target)
         
         except Exception as e:
-            self._update_stats(success=False)
-            logger.error("Confluence space retrieval error", space_key=space_key, error=str(e))
-            raise ExternalAPIError(f"스페이스 조회 오류: {str(e)}", service="confluence", operation="get_space")
+            self._counters.record(success=False)
+            logger.error("Confluence request error", operation=operation, target=target, error=str(e))
+            raise ExternalAPIError(
+                f"{_OPERATION_LABELS[operation]} 오류: {str(e)}",
+                service="confluence",
+                operation=operation
+            )
     
     async def health_check(self) -> Dict[str, Any]:
         """Confluence 연결 상태 확인"""
         
-        if not self.client:
-            await self.connect()
-        
         try:
             # 간단한 API 호출로 연결 상태 확인
+            start_ns = time.perf_counter_ns()
             response = await self.client.get(
                 self.config.get_space_url(),
-                params={"limit": 1}
+                params={"limit": 1},
+                **self._request_kwargs
             )
             response.raise_for_status()
             
             return {
                 "status": "healthy",
-                "response_time_ms": response.elapsed.total_seconds() * 1000,
-                "stats": self.stats.dict()
+                "response_time_ms": (time.perf_counter_ns() - start_ns) / 1e6,
+                "stats": self.get_stats().model_dump()
             }
             
         except Exception as e:
@@ -270,45 +419,44 @@ class ConfluenceClient:
             return {
                 "status": "unhealthy",
                 "error": str(e),
-                "stats": self.stats.dict()
+                "stats": self.get_stats().model_dump()
             }
     
-    def _update_stats(self, success: bool, response_time: float = None):
-        """통계 정보 업데이트"""
-        self.stats.total_requests += 1
-        
-        if success:
-            self.stats.successful_requests += 1
-            if response_time:
-                # 이동 평균 계산
-                if self.stats.average_response_time == 0:
-                    self.stats.average_response_time = response_time * 1000
-                else:
-                    self.stats.average_response_time = (
-                        self.stats.average_response_time * 0.9 + 
-                        response_time * 1000 * 0.1
-                    )
-        else:
-            self.stats.failed_requests += 1
+    def _should_log_completion(self) -> bool:
+        """완료 로그 샘플링 (completion_log_sample건마다 한 번)"""
+        return next(self._completion_log_counter) % self.config.completion_log_sample == 0
     
     def get_stats(self) -> ConfluenceStats:
         """통계 정보 반환"""
-        return self.stats
+        return ConfluenceStats(
+            **self._counters.snapshot(),
+            cache_hits=self._cache.hits,
+            batch_size_histogram=dict(self._batch_sizes)
+        )
 
 
 # 전역 클라이언트 인스턴스 관리
 _confluence_client: Optional[ConfluenceClient] = None
+_confluence_client_lock = asyncio.Lock()
 
 
 async def get_confluence_client() -> ConfluenceClient:
-    """Confluence 클라이언트 인스턴스 반환"""
+    """Confluence 클라이언트 인스턴스 반환 (앱 시작 시 lifespan에서 미리 생성)"""
     global _confluence_client
     
-    if _confluence_client is None:
-        _confluence_client = ConfluenceClient()
-        await _confluence_client.connect()
+    # 종료(close)된 인스턴스는 재사용하지 않고 새로 생성
+    client = _confluence_client
+    if client is not None and client.client is not None:
+        return client
+    
+    async with _confluence_client_lock:
+        client = _confluence_client
+        if client is None or client.client is None:
+            client = ConfluenceClient()
+            await client.connect()
+            _confluence_client = client
     
-    return _confluence_client
+    return client
 
 
 async def close_confluence_client():
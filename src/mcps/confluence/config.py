@@ -17,42 +17,48 @@ class ConfluenceConfig:
         self.timeout = settings.confluence.timeout
         self.max_retries = settings.confluence.max_retries
         self.retry_delay = settings.confluence.retry_delay
+        self.retry_base_delay = settings.confluence.retry_base_delay
+        self.retry_max_delay = settings.confluence.retry_max_delay
+        self.retry_jitter = settings.confluence.retry_jitter
+        self.cache_ttl = settings.confluence.cache_ttl
+        self.cache_max_size = settings.confluence.cache_max_size
+        self.batch_window = settings.confluence.batch_window
+        self.batch_max_size = settings.confluence.batch_max_size
+        self.completion_log_sample = settings.confluence.completion_log_sample
         self.max_results = settings.confluence.max_results
         self.default_expand = settings.confluence.default_expand
-    
-    @property
-    def auth_tuple(self) -> tuple:
-        """인증 튜플 (email, api_token)"""
-        return (self.email, self.api_token)
-    
-    @property
-    def api_base_url(self) -> str:
-        """API 베이스 URL"""
-        return f"{self.base_url}/wiki/rest/api"
-    
-    @property
-    def headers(self) -> Dict[str, str]:
-        """기본 HTTP 헤더"""
-        return {
+        
+        # 요청마다 재사용하는 값은 초기화 시 한 번만 생성
+        self.auth_tuple = (self.email, self.api_token)
+        self.headers: Dict[str, str] = {
             "Accept": "application/json",
             "Content-Type": "application/json"
         }
+        self.api_base_url = f"{self.base_url}/wiki/rest/api"
+        self._search_url = f"{self.api_base_url}/search"
+        self._content_url = f"{self.api_base_url}/content"
+        self._content_search_url = f"{self._content_url}/search"
+        self._space_url = f"{self.api_base_url}/space"
     
     def get_search_url(self) -> str:
         """검색 API URL"""
-        return f"{self.api_base_url}/search"
+        return self._search_url
     
     def get_content_url(self, content_id: str = None) -> str:
         """콘텐츠 API URL"""
         if content_id:
-            return f"{self.api_base_url}/content/{content_id}"
-        return f"{self.api_base_url}/content"
+            return f"{self._content_url}/{content_id}"
+        return self._content_url
+    
+    def get_content_search_url(self) -> str:
+        """콘텐츠 CQL 검색 API URL"""
+        return self._content_search_url
     
     def get_space_url(self, space_key: str = None) -> str:
         """스페이스 API URL"""
         if space_key:
-            return f"{self.api_base_url}/space/{space_key}"
-        return f"{self.api_base_url}/space"
+            return f"{self._space_url}/{space_key}"
+        return self._space_url
     
     def get_user_url(self, account_id: str = None) -> str:
         """사용자 API URL"""
@@ -87,6 +93,14 @@ class ConfluenceConfig:
             "timeout": self.timeout,
             "max_retries": self.max_retries,
             "retry_delay": self.retry_delay,
+            "retry_base_delay": self.retry_base_delay,
+            "retry_max_delay": self.retry_max_delay,
+            "retry_jitter": self.retry_jitter,
+            "cache_ttl": self.cache_ttl,
+            "cache_max_size": self.cache_max_size,
+            "batch_window": self.batch_window,
+            "batch_max_size": self.batch_max_size,
+            "completion_log_sample": self.completion_log_sample,
             "max_results": self.max_results,
             "default_expand": self.default_expand,
             "api_base_url": self.api_base_url
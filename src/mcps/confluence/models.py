@@ -5,6 +5,7 @@ from pydantic import BaseModel, Field, field_validator
 from datetime import datetime
 
 from ...shared.models import BaseResponseModel
+from ...shared.utils import CQL_FORBIDDEN_PATTERN
 
 
 class ConfluenceSearchRequest(BaseModel):
@@ -23,15 +24,9 @@ class ConfluenceSearchRequest(BaseModel):
             raise ValueError("CQL 쿼리는 비어있을 수 없습니다")
         
         # 위험한 패턴 검사
-        dangerous_patterns = [
-            "user.", "accountid", "script", ";", "--", "/*", "*/",
-            "drop", "delete", "update", "insert", "create", "alter"
-        ]
-        
-        v_lower = v.lower()
-        for pattern in dangerous_patterns:
-            if pattern in v_lower:
-                raise ValueError(f"금지된 CQL 패턴: {pattern}")
+        match = CQL_FORBIDDEN_PATTERN.search(v)
+        if match:
+            raise ValueError(f"금지된 CQL 패턴: {match.group(0).lower()}")
         
         return v.strip()
 
@@ -90,7 +85,7 @@ class ConfluenceSearchResult(BaseModel):
     size: int = Field(description="실제 결과 수")
     total_size: Optional[int] = Field(None, description="전체 결과 수")
     cursor: Optional[str] = Field(None, description="다음 페이지 커서")
-    _links: Optional[Dict[str, Any]] = Field(None, description="링크 정보")
+    links: Optional[Dict[str, Any]] = Field(None, alias="_links", description="링크 정보")
 
 
 class ConfluenceSpace(BaseModel):
@@ -104,7 +99,7 @@ class ConfluenceSpace(BaseModel):
     description: Optional[Dict[str, Any]] = Field(None, description="설명")
     homepage: Optional[Dict[str, Any]] = Field(None, description="홈페이지 정보")
     metadata: Optional[Dict[str, Any]] = Field(None, description="메타데이터")
-    _links: Optional[Dict[str, Any]] = Field(None, description="링크 정보")
+    links: Optional[Dict[str, Any]] = Field(None, alias="_links", description="링크 정보")
 
 
 class ConfluenceUser(BaseModel):
@@ -114,7 +109,7 @@ class ConfluenceUser(BaseModel):
     display_name: str = Field(description="표시 이름")
     email: Optional[str] = Field(None, description="이메일")
     profile_picture: Optional[Dict[str, Any]] = Field(None, description="프로필 사진")
-    _links: Optional[Dict[str, Any]] = Field(None, description="링크 정보")
+    links: Optional[Dict[str, Any]] = Field(None, alias="_links", description="링크 정보")
 
 
 class ConfluenceAttachment(BaseModel):
@@ -164,5 +159,7 @@ class ConfluenceStats(BaseModel):
     successful_requests: int = Field(description="성공한 요청 수")
     failed_requests: int = Field(description="실패한 요청 수")
     average_response_time: float = Field(description="평균 응답 시간(ms)")
+    cache_hits: int = Field(default=0, description="캐시 적중 수")
+    batch_size_histogram: Dict[int, int] = Field(default_factory=dict, description="페이지 배치 크기별 횟수")
     rate_limit_remaining: Optional[int] = Field(None, description="남은 레이트 리미트")
     last_request_time: Optional[datetime] = Field(None, description="마지막 요청 시간")
\ No newline at end of file
@@ -1,7 +1,7 @@
 """Confluence MCP 라우터"""
 
 from typing import Dict, Any, Optional
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
 import structlog
 
 from ...shared.utils import validate_cql_query, format_error_response, create_success_response
@@ -22,6 +22,14 @@ logger = structlog.get_logger(__name__)
 router = APIRouter(tags=["confluence"])
 
 
+async def get_app_confluence_client(request: Request) -> ConfluenceClient:
+    """lifespan에서 생성해 app.state에 등록한 클라이언트 반환 (미등록 시 지연 생성)"""
+    client = request.app.state.clients.get("confluence")
+    if client is None:
+        client = await get_confluence_client()
+    return client
+
+
 @router.get("/search", 
            response_model=ConfluenceSearchResponse,
            operation_id="confluence_search",
@@ -32,7 +40,8 @@ async def search_confluence(
     limit: int = Query(25, description="결과 제한 수", ge=1, le=100),
     cursor: Optional[str] = Query(None, description="페이지네이션 커서"),
     expand: Optional[str] = Query(None, description="확장할 필드들"),
-    client: ConfluenceClient = Depends(get_confluence_client),
+    no_cache: bool = Query(False, description="캐시를 무시하고 새로 조회"),
+    client: ConfluenceClient = Depends(get_app_confluence_client),
     user: Optional[Dict[str, Any]] = Depends(get_optional_user)
 ):
     """Confluence 콘텐츠 검색"""
@@ -53,7 +62,8 @@ async def search_confluence(
             cql=validated_cql,
             limit=limit,
             cursor=cursor,
-            expand=expand
+            expand=expand,
+            no_cache=no_cache
         )
         
         logger.info(
@@ -90,7 +100,7 @@ async def search_confluence(
 async def get_confluence_page(
     page_id: str = Query(..., description="페이지 ID"),
     expand: str = Query("body.storage,version", description="확장할 필드들"),
-    client: ConfluenceClient = Depends(get_confluence_client),
+    client: ConfluenceClient = Depends(get_app_confluence_client),
     user: Optional[Dict[str, Any]] = Depends(get_optional_user)
 ):
     """Confluence 페이지 조회"""
@@ -140,7 +150,7 @@ async def get_confluence_page(
 async def get_confluence_space(
     space_key: str = Query(..., description="스페이스 키"),
     expand: Optional[str] = Query(None, description="확장할 필드들"),
-    client: ConfluenceClient = Depends(get_confluence_client),
+    client: ConfluenceClient = Depends(get_app_confluence_client),
     user: Optional[Dict[str, Any]] = Depends(get_optional_user)
 ):
     """Confluence 스페이스 조회"""
@@ -186,7 +196,7 @@ async def get_confluence_space(
            summary="Confluence 서비스 상태 확인",
            description="Confluence 서비스의 연결 상태와 통계 정보를 확인합니다")
 async def confluence_health(
-    client: ConfluenceClient = Depends(get_confluence_client)
+    client: ConfluenceClient = Depends(get_app_confluence_client)
 ):
     """Confluence 서비스 헬스체크"""
     
@@ -215,7 +225,7 @@ async def confluence_health(
            summary="Confluence 통계 정보",
            description="Confluence 클라이언트의 통계 정보를 반환합니다")
 async def confluence_stats(
-    client: ConfluenceClient = Depends(get_confluence_client)
+    client: ConfluenceClient = Depends(get_app_confluence_client)
 ):
     """Confluence 통계 정보"""
     
@@ -225,7 +235,7 @@ async def confluence_stats(
         logger.info("Confluence stats retrieved")
         
         return create_success_response(
-            data=stats.dict(),
+            data=stats.model_dump(),
             message="Confluence 통계 정보 조회 완료"
         )
         
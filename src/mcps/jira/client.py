@@ -1,11 +1,20 @@
 """JIRA API 클라이언트"""
 
 import asyncio
-from typing import Dict, Any, Optional, List
+import time
+from typing import Any, AsyncIterator, Dict, List, NoReturn, Optional, Tuple, Type, TypeVar
 import httpx
 import structlog
+from pydantic import BaseModel
 
-from ...shared.utils import retry_with_backoff, measure_time
+try:
+    import ijson
+except ImportError:  # ijson은 선택 의존성 (없으면 전체 응답을 받은 뒤 파싱)
+    ijson = None
+
+from ...shared.cache import SingleFlight, TTLCache
+from ...shared.utils import StatusErrorTable, normalize_query, raise_for_status_error, retry_with_backoff, run_all
+from ...shared.stats import RequestCounters
 from ...shared.exceptions import ExternalAPIError, AuthenticationError, RateLimitError
 from .config import jira_config
 from .models import (
@@ -17,6 +26,64 @@ from .models import (
 
 logger = structlog.get_logger(__name__)
 
+_ModelT = TypeVar("_ModelT", bound=BaseModel)
+
+# 캐시 키 정규화 시 대소문자를 통일하는 JQL 예약어
+_JQL_CASE_INSENSITIVE_KEYWORDS = frozenset({
+    "and", "or", "not", "in", "is", "was", "empty", "null", "order", "by", "asc", "desc"
+})
+
+
+# 모든 작업에 공통인 상태 코드 매핑
+_COMMON_STATUS_ERRORS: StatusErrorTable = {
+    401: (AuthenticationError, "JIRA 인증 실패", "error"),
+    429: (RateLimitError, "JIRA 레이트 리미트 초과", "warning"),
+}
+# 작업별 상태 코드 → (예외 클래스, 메시지 템플릿, 로그 레벨)
+_STATUS_ERRORS: Dict[str, StatusErrorTable] = {
+    "search": {
+        **_COMMON_STATUS_ERRORS,
+        400: (ExternalAPIError, "잘못된 JQL 쿼리: {target}", "error"),
+        403: (AuthenticationError, "JIRA 접근 권한 없음", "error"),
+    },
+    "get_issue": {
+        **_COMMON_STATUS_ERRORS,
+        403: (AuthenticationError, "이슈 접근 권한 없음", "error"),
+        404: (ExternalAPIError, "이슈를 찾을 수 없습니다: {target}", "warning"),
+    },
+    "get_project": {
+        **_COMMON_STATUS_ERRORS,
+        403: (AuthenticationError, "프로젝트 접근 권한 없음", "error"),
+        404: (ExternalAPIError, "프로젝트를 찾을 수 없습니다: {target}", "warning"),
+    },
+}
+# 작업별 오류 메시지 접두어
+_OPERATION_LABELS = {
+    "search": "JIRA 검색",
+    "get_issue": "이슈 조회",
+    "get_project": "프로젝트 조회",
+}
+
+
+def _raise_for_status(error: httpx.HTTPStatusError, operation: str, target: Optional[str] = None) -> NoReturn:
+    """HTTP 상태 오류를 작업별 MCP 예외로 변환"""
+    raise_for_status_error(
+        error, _STATUS_ERRORS[operation], _OPERATION_LABELS[operation], "jira", operation, target
+    )
+
+
+class _AsyncByteReader:
+    """바이트 청크 비동기 이터레이터를 ijson이 읽을 수 있는 read() 인터페이스로 감쌈"""
+    
+    def __init__(self, chunks: AsyncIterator[bytes]):
+        self._chunks = chunks
+    
+    async def read(self, size: int = -1) -> bytes:
+        # ijson은 read(0)으로 입력 타입을 확인하므로 청크를 소비하지 않음
+        if size == 0:
+            return b""
+        return await anext(self._chunks, b"")
+
 
 class JiraClient:
     """JIRA API 클라이언트"""
@@ -27,12 +94,15 @@ class JiraClient:
         
         self.config = jira_config
         self.client: Optional[httpx.AsyncClient] = None
-        self.stats = JiraStats(
-            total_requests=0,
-            successful_requests=0,
-            failed_requests=0,
-            average_response_time=0.0
-        )
+        self._http_version_logged = False
+        # 클라이언트 공통 컨텍스트는 한 번만 바인딩
+        self._log = logger.bind(service="jira")
+        # 조회 응답 TTL 캐시
+        self._cache = TTLCache(self.config.cache_max_size)
+        # 진행 중인 요청 병합 (키 → 업스트림 호출 태스크)
+        self._inflight = SingleFlight()
+        # 평균 응답 시간은 누적 평균 (모든 측정값을 동일한 가중치로 반영)
+        self._counters = RequestCounters()
     
     async def __aenter__(self):
         """비동기 컨텍스트 매니저 시작"""
@@ -46,274 +116,341 @@ class JiraClient:
     async def connect(self):
         """HTTP 클라이언트 연결"""
         if self.client is None:
+            # 연결 오류 재시도는 트랜스포트에서 처리 (상태 코드 재시도만 retry_with_backoff에서 수행)
+            transport = httpx.AsyncHTTPTransport(
+                retries=self.config.max_retries,
+                http2=self.config.http2,
+                limits=self.config.limits
+            )
             self.client = httpx.AsyncClient(
-                auth=self.config.auth_tuple,
-                timeout=httpx.Timeout(self.config.timeout),
+                timeout=self.config.timeout_config,
                 headers=self.config.headers,
-                limits=httpx.Limits(max_keepalive_connections=5, max_connections=10)
+                transport=transport
             )
-            logger.info("JIRA client connected", base_url=self.config.base_url)
+            self._http_version_logged = False
+            self._log.info("JIRA client connected", base_url=self.config.base_url, http2=self.config.http2)
     
     async def close(self):
         """HTTP 클라이언트 종료"""
         if self.client:
             await self.client.aclose()
             self.client = None
-            logger.info("JIRA client disconnected")
+            self._log.info("JIRA client disconnected")
     
-    @measure_time
     async def search_issues(
         self,
         jql: str,
         start_at: int = 0,
         max_results: int = 50,
-        expand: Optional[str] = None
+        expand: Optional[str] = None,
+        no_cache: bool = False
     ) -> JiraSearchResult:
-        """JQL을 사용한 이슈 검색"""
-        
-        if not self.client:
-            await self.connect()
+        """JQL을 사용한 이슈 검색 (jql/max_results는 JiraSearchRequest로 검증된 값을 전달)"""
         
         params = {
             "jql": jql,
             "startAt": start_at,
-            "maxResults": min(max_results, 100)
+            "maxResults": max_results
         }
         
         if expand:
             params["expand"] = expand
         
-        try:
-            logger.info("JIRA search started", jql=jql, max_results=max_results)
-            
-            response = await retry_with_backoff(
-                self.client,
-                "GET",
-                self.config.get_search_url(),
-                params=params,
-                max_retries=self.config.max_retries
-            )
-            
-            self._update_stats(success=True, response_time=response.elapsed.total_seconds())
-            
-            data = response.json()
-            logger.info("JIRA search completed", total_results=data.get("total", 0))
-            
-            return JiraSearchResult(**data)
-            
-        except httpx.HTTPStatusError as e:
-            self._update_stats(success=False)
-            
-            if e.response.status_code == 401:
-                logger.error("JIRA authentication failed")
-                raise AuthenticationError("JIRA 인증 실패", service="jira", operation="search")
-            elif e.response.status_code == 403:
-                logger.error("JIRA access forbidden")
-                raise AuthenticationError("JIRA 접근 권한 없음", service="jira", operation="search")
-            elif e.response.status_code == 429:
-                logger.warning("JIRA rate limit exceeded")
-                raise RateLimitError("JIRA 레이트 리미트 초과", service="jira", operation="search")
-            elif e.response.status_code == 400:
-                logger.error("Invalid JQL query", jql=jql)
-                raise ExternalAPIError(
-                    f"잘못된 JQL 쿼리: {jql}",
-                    status_code=400,
-                    service="jira",
-                    operation="search"
-                )
-            else:
-                logger.error("JIRA search failed", status_code=e.response.status_code, error=str(e))
-                raise ExternalAPIError(
-                    f"JIRA 검색 실패: {e.response.status_code}",
-                    status_code=e.response.status_code,
-                    service="jira",
-                    operation="search"
-                )
+        # 검색 결과는 자주 바뀌므로 짧은 TTL로만 캐시
+        # (표기만 다른 동일 쿼리가 같은 캐시 항목을 사용하도록 정규화된 JQL로 키 생성)
+        cache_key = ("search", normalize_query(jql, _JQL_CASE_INSENSITIVE_KEYWORDS), start_at, max_results, expand)
+        if not no_cache:
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                return cached
         
-        except Exception as e:
-            self._update_stats(success=False)
-            logger.error("JIRA search error", error=str(e))
-            raise ExternalAPIError(f"JIRA 검색 오류: {str(e)}", service="jira", operation="search")
+        # 동시에 들어온 동일 검색은 하나의 호출로 병합
+        return await self._inflight.do(
+            cache_key,
+            lambda: self._request(
+                self.config.get_search_url(), params, JiraSearchResult, "search", jql,
+                cache_key, self.config.search_cache_ttl
+            )
+        )
     
-    @measure_time
     async def get_issue(
         self,
         issue_key: str,
-        expand: Optional[str] = None
+        expand: Optional[str] = None,
+        no_cache: bool = False
     ) -> JiraIssue:
         """이슈 상세 정보 조회"""
         
-        if not self.client:
-            await self.connect()
+        params = {}
+        if expand:
+            params["expand"] = expand
+        
+        cache_key = ("issue", issue_key, expand)
+        if not no_cache:
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                return cached
+        
+        # 동일한 요청이 진행 중이면 새로 호출하지 않고 그 결과를 공유
+        return await self._inflight.do(
+            cache_key,
+            lambda: self._request(
+                self.config.get_issue_url(issue_key), params, JiraIssue, "get_issue", issue_key,
+                cache_key, self.config.issue_cache_ttl
+            )
+        )
+    
+    async def get_project(
+        self,
+        project_key: str,
+        expand: Optional[str] = None,
+        no_cache: bool = False
+    ) -> JiraProject:
+        """프로젝트 정보 조회"""
         
         params = {}
         if expand:
             params["expand"] = expand
         
+        cache_key = ("project", project_key, expand)
+        if not no_cache:
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                return cached
+        
+        # 동일한 요청이 진행 중이면 새로 호출하지 않고 그 결과를 공유
+        return await self._inflight.do(
+            cache_key,
+            lambda: self._request(
+                self.config.get_project_url(project_key), params, JiraProject, "get_project", project_key,
+                cache_key, self.config.project_cache_ttl
+            )
+        )
+    
+    async def _request(
+        self,
+        url: str,
+        params: Dict[str, Any],
+        model_cls: Type[_ModelT],
+        operation: str,
+        target: str,
+        cache_key: Optional[Tuple] = None,
+        cache_ttl: float = 0.0
+    ) -> _ModelT:
+        """GET 요청 실행 후 응답을 모델로 검증 (cache_key가 있으면 캐시에 저장)"""
+        
         try:
-            logger.info("JIRA issue retrieval started", issue_key=issue_key)
+            self._log.debug("JIRA request started", operation=operation, target=target)
             
+            start_ns = time.perf_counter_ns()
             response = await retry_with_backoff(
                 self.client,
                 "GET",
-                self.config.get_issue_url(issue_key),
+                url,
                 params=params,
-                max_retries=self.config.max_retries
+                max_retries=self.config.max_retries,
+                retry_request_errors=False
             )
             
-            self._update_stats(success=True, response_time=response.elapsed.total_seconds())
+            response_ms = (time.perf_counter_ns() - start_ns) / 1e6
+            self._counters.record(success=True, response_ms=response_ms)
+            self._log_http_version(response)
             
-            data = response.json()
-            logger.info("JIRA issue retrieved", issue_key=issue_key, summary=data.get("fields", {}).get("summary"))
+            # 중간 dict 없이 응답 바이트에서 바로 모델로 검증
+            result = model_cls.model_validate_json(response.content)
+            self._log.debug("JIRA request completed", operation=operation, target=target, duration_ms=response_ms)
             
-            return JiraIssue(**data)
+            if cache_key is not None:
+                self._cache.set(cache_key, result, cache_ttl)
+            return result
             
         except httpx.HTTPStatusError as e:
-            self._update_stats(success=False)
-            
-            if e.response.status_code == 404:
-                logger.warning("JIRA issue not found", issue_key=issue_key)
-                raise ExternalAPIError(f"이슈를 찾을 수 없습니다: {issue_key}", status_code=404, service="jira", operation="get_issue")
-            elif e.response.status_code == 401:
-                logger.error("JIRA authentication failed")
-                raise AuthenticationError("JIRA 인증 실패", service="jira", operation="get_issue")
-            elif e.response.status_code == 403:
-                logger.error("JIRA access forbidden", issue_key=issue_key)
-                raise AuthenticationError("이슈 접근 권한 없음", service="jira", operation="get_issue")
-            else:
-                logger.error("JIRA issue retrieval failed", issue_key=issue_key, status_code=e.response.status_code)
-                raise ExternalAPIError(
-                    f"이슈 조회 실패: {e.response.status_code}",
-                    status_code=e.response.status_code,
-                    service="jira",
-                    operation="get_issue"
-                )
+            self._counters.record(success=False)
+            _raise_for_status(e, operation, target)
         
         except Exception as e:
-            self._update_stats(success=False)
-            logger.error("JIRA issue retrieval error", issue_key=issue_key, error=str(e))
-            raise ExternalAPIError(f"이슈 조회 오류: {str(e)}", service="jira", operation="get_issue")
+            self._counters.record(success=False)
+            self._log.error("JIRA request error", operation=operation, target=target, error=str(e))
+            raise ExternalAPIError(
+                f"{_OPERATION_LABELS[operation]} 오류: {str(e)}",
+                service="jira",
+                operation=operation
+            )
     
-    @measure_time
-    async def get_project(
+    async def search_issues_stream(
         self,
-        project_key: str,
+        jql: str,
+        start_at: int = 0,
+        max_results: int = 50,
         expand: Optional[str] = None
-    ) -> JiraProject:
-        """프로젝트 정보 조회"""
+    ) -> AsyncIterator[JiraIssue]:
+        """JQL 검색 결과를 응답 수신과 동시에 이슈 단위로 파싱하여 반환
         
-        if not self.client:
-            await self.connect()
+        ijson이 없으면 search_issues 결과를 순회합니다. 스트리밍 경로는 429/5xx 재시도를 하지 않습니다.
+        """
+        
+        if ijson is None:
+            result = await self.search_issues(jql, start_at, max_results, expand)
+            for issue in result.issues:
+                yield issue
+            return
+        
+        params = {
+            "jql": jql,
+            "startAt": start_at,
+            "maxResults": max_results
+        }
         
-        params = {}
         if expand:
             params["expand"] = expand
         
         try:
-            logger.info("JIRA project retrieval started", project_key=project_key)
-            
-            response = await retry_with_backoff(
-                self.client,
-                "GET",
-                self.config.get_project_url(project_key),
-                params=params,
-                max_retries=self.config.max_retries
-            )
-            
-            self._update_stats(success=True, response_time=response.elapsed.total_seconds())
+            self._log.debug("JIRA search stream started", jql=jql, max_results=max_results)
             
-            data = response.json()
-            logger.info("JIRA project retrieved", project_key=project_key, name=data.get("name"))
+            start_ns = time.perf_counter_ns()
+            async with self.client.stream("GET", self.config.get_search_url(), params=params) as response:
+                response.raise_for_status()
+                
+                reader = _AsyncByteReader(response.aiter_bytes())
+                async for item in ijson.items_async(reader, "issues.item", use_float=True):
+                    yield JiraIssue.model_validate(item)
             
-            return JiraProject(**data)
+            self._counters.record(success=True, response_ms=(time.perf_counter_ns() - start_ns) / 1e6)
             
         except httpx.HTTPStatusError as e:
-            self._update_stats(success=False)
-            
-            if e.response.status_code == 404:
-                logger.warning("JIRA project not found", project_key=project_key)
-                raise ExternalAPIError(f"프로젝트를 찾을 수 없습니다: {project_key}", status_code=404, service="jira", operation="get_project")
-            elif e.response.status_code == 401:
-                logger.error("JIRA authentication failed")
-                raise AuthenticationError("JIRA 인증 실패", service="jira", operation="get_project")
-            elif e.response.status_code == 403:
-                logger.error("JIRA access forbidden", project_key=project_key)
-                raise AuthenticationError("프로젝트 접근 권한 없음", service="jira", operation="get_project")
-            else:
-                logger.error("JIRA project retrieval failed", project_key=project_key, status_code=e.response.status_code)
-                raise ExternalAPIError(
-                    f"프로젝트 조회 실패: {e.response.status_code}",
-                    status_code=e.response.status_code,
-                    service="jira",
-                    operation="get_project"
-                )
+            self._counters.record(success=False)
+            _raise_for_status(e, "search", jql)
         
         except Exception as e:
-            self._update_stats(success=False)
-            logger.error("JIRA project retrieval error", project_key=project_key, error=str(e))
-            raise ExternalAPIError(f"프로젝트 조회 오류: {str(e)}", service="jira", operation="get_project")
+            self._counters.record(success=False)
+            self._log.error("JIRA search stream error", error=str(e))
+            raise ExternalAPIError(f"{_OPERATION_LABELS['search']} 오류: {str(e)}", service="jira", operation="search")
+    
+    async def search_issues_all(
+        self,
+        jql: str,
+        page_size: int = 100,
+        max_concurrent: int = 8,
+        expand: Optional[str] = None
+    ) -> List[JiraIssue]:
+        """JQL 검색 결과 전체 조회 (첫 페이지로 전체 수를 확인한 뒤 나머지 페이지를 동시 요청)"""
+        
+        page_size = min(page_size, 100)
+        first = await self.search_issues(jql, 0, page_size, expand)
+        
+        semaphore = asyncio.BoundedSemaphore(max_concurrent)
+        
+        async def fetch(start_at: int) -> JiraSearchResult:
+            async with semaphore:
+                return await self.search_issues(jql, start_at, page_size, expand)
+        
+        rest = await run_all([
+            fetch(start_at) for start_at in range(page_size, first.total, page_size)
+        ])
+        
+        issues = list(first.issues)
+        for page in rest:
+            issues.extend(page.issues)
+        return issues
+    
+    async def get_issues_bulk(
+        self,
+        issue_keys: List[str],
+        max_concurrent: int = 8,
+        expand: Optional[str] = None
+    ) -> List[JiraIssue]:
+        """여러 이슈를 동시에 조회 (입력 순서대로 반환)"""
+        
+        semaphore = asyncio.BoundedSemaphore(max_concurrent)
+        
+        async def fetch(issue_key: str) -> JiraIssue:
+            async with semaphore:
+                return await self.get_issue(issue_key, expand)
+        
+        return await run_all([fetch(issue_key) for issue_key in issue_keys])
     
     async def health_check(self) -> Dict[str, Any]:
         """JIRA 연결 상태 확인"""
         
-        if not self.client:
-            await self.connect()
-        
         try:
             # 간단한 API 호출로 연결 상태 확인
+            start_ns = time.perf_counter_ns()
             response = await self.client.get(f"{self.config.api_base_url}/serverInfo")
             response.raise_for_status()
             
             return {
                 "status": "healthy",
-                "response_time_ms": response.elapsed.total_seconds() * 1000,
-                "stats": self.stats.dict()
+                "response_time_ms": (time.perf_counter_ns() - start_ns) / 1e6,
+                "stats": self._stats_snapshot()
             }
             
         except Exception as e:
-            logger.error("JIRA health check failed", error=str(e))
+            self._log.error("JIRA health check failed", error=str(e))
             return {
                 "status": "unhealthy",
                 "error": str(e),
-                "stats": self.stats.dict()
+                "stats": self._stats_snapshot()
             }
     
-    def _update_stats(self, success: bool, response_time: float = None):
-        """통계 정보 업데이트"""
-        self.stats.total_requests += 1
-        
-        if success:
-            self.stats.successful_requests += 1
-            if response_time:
-                # 이동 평균 계산
-                if self.stats.average_response_time == 0:
-                    self.stats.average_response_time = response_time * 1000
-                else:
-                    self.stats.average_response_time = (
-                        self.stats.average_response_time * 0.9 + 
-                        response_time * 1000 * 0.1
-                    )
-        else:
-            self.stats.failed_requests += 1
+    def invalidate_issue(self, issue_key: str):
+        """이슈 캐시 무효화 (모든 expand 변형 포함)"""
+        self._invalidate("issue", issue_key)
+    
+    def invalidate_project(self, project_key: str):
+        """프로젝트 캐시 무효화 (모든 expand 변형 포함)"""
+        self._invalidate("project", project_key)
+    
+    def _invalidate(self, kind: str, key: str):
+        """종류와 키가 일치하는 캐시 항목 제거"""
+        for cache_key in [k for k in self._cache if k[0] == kind and k[1] == key]:
+            self._cache.pop(cache_key)
+    
+    def _log_http_version(self, response: httpx.Response):
+        """협상된 HTTP 버전을 연결당 한 번만 기록"""
+        if not self._http_version_logged:
+            self._http_version_logged = True
+            self._log.info("JIRA HTTP version negotiated", http_version=response.http_version)
+    
+    def _stats_snapshot(self) -> Dict[str, Any]:
+        """헬스체크용 통계 (JiraStats와 같은 키, 모델 생성/직렬화 없이 카운터에서 바로 구성)"""
+        return {
+            **self._counters.snapshot(),
+            "cache_hits": self._cache.hits,
+            "cache_misses": self._cache.misses,
+            "last_request_time": None
+        }
     
     def get_stats(self) -> JiraStats:
         """통계 정보 반환"""
-        return self.stats
+        return JiraStats(
+            **self._counters.snapshot(),
+            cache_hits=self._cache.hits,
+            cache_misses=self._cache.misses
+        )
 
 
 # 전역 클라이언트 인스턴스 관리
 _jira_client: Optional[JiraClient] = None
+_jira_client_lock = asyncio.Lock()
 
 
 async def get_jira_client() -> JiraClient:
-    """JIRA 클라이언트 인스턴스 반환"""
+    """JIRA 클라이언트 인스턴스 반환 (앱 시작 시 lifespan에서 미리 생성)"""
     global _jira_client
     
-    if _jira_client is None:
-        _jira_client = JiraClient()
-        await _jira_client.connect()
+    # 종료(close)된 인스턴스는 재사용하지 않고 새로 생성
+    client = _jira_client
+    if client is not None and client.client is not None:
+        return client
+    
+    async with _jira_client_lock:
+        client = _jira_client
+        if client is None or client.client is None:
+            client = JiraClient()
+            await client.connect()
+            _jira_client = client
     
-    return _jira_client
+    return client
 
 
 async def close_jira_client():
@@ -1,7 +1,12 @@
 """JIRA MCP 설정"""
 
-from typing import Dict, Any
+import base64
+from functools import cached_property
+from types import MappingProxyType
+from typing import Dict, Any, Mapping
+import httpx
 from ...config.settings import settings
+from ...shared.utils import HTTP2_ENABLED
 
 
 class JiraConfig:
@@ -16,40 +21,51 @@ class JiraConfig:
         self.api_token = settings.jira.api_token
         self.timeout = settings.jira.timeout
         self.max_retries = settings.jira.max_retries
-    
-    @property
-    def auth_tuple(self) -> tuple:
-        """인증 튜플 (email, api_token)"""
-        return (self.email, self.api_token)
-    
-    @property
-    def api_base_url(self) -> str:
-        """API 베이스 URL"""
-        return f"{self.base_url}/rest/api/3"
-    
-    @property
-    def headers(self) -> Dict[str, str]:
-        """기본 HTTP 헤더"""
-        return {
+        self.max_connections = settings.jira.max_connections
+        self.max_keepalive_connections = settings.jira.max_keepalive_connections
+        self.keepalive_expiry = settings.jira.keepalive_expiry
+        # h2 패키지가 없으면 설정과 관계없이 HTTP/1.1 사용
+        self.http2 = settings.jira.http2 and HTTP2_ENABLED
+        self.search_cache_ttl = settings.jira.search_cache_ttl
+        self.issue_cache_ttl = settings.jira.issue_cache_ttl
+        self.project_cache_ttl = settings.jira.project_cache_ttl
+        self.cache_max_size = settings.jira.cache_max_size
+        
+        # 요청마다 재사용하는 값은 초기화 시 한 번만 생성
+        # auth_tuple은 호환용으로만 유지 (클라이언트는 Authorization 헤더를 직접 사용)
+        self.auth_tuple = (self.email, self.api_token)
+        credentials = base64.b64encode(f"{self.email}:{self.api_token}".encode()).decode()
+        self.headers: Dict[str, str] = {
             "Accept": "application/json",
-            "Content-Type": "application/json"
+            "Content-Type": "application/json",
+            "Authorization": f"Basic {credentials}"
         }
+        self.timeout_config = httpx.Timeout(self.timeout)
+        self.limits = httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry
+        )
+        self.api_base_url = f"{self.base_url}/rest/api/3"
+        self._search_url = f"{self.api_base_url}/search"
+        self._issue_url = f"{self.api_base_url}/issue"
+        self._project_url = f"{self.api_base_url}/project"
     
     def get_search_url(self) -> str:
         """검색 API URL"""
-        return f"{self.api_base_url}/search"
+        return self._search_url
     
     def get_issue_url(self, issue_key: str = None) -> str:
         """이슈 API URL"""
         if issue_key:
-            return f"{self.api_base_url}/issue/{issue_key}"
-        return f"{self.api_base_url}/issue"
+            return f"{self._issue_url}/{issue_key}"
+        return self._issue_url
     
     def get_project_url(self, project_key: str = None) -> str:
         """프로젝트 API URL"""
         if project_key:
-            return f"{self.api_base_url}/project/{project_key}"
-        return f"{self.api_base_url}/project"
+            return f"{self._project_url}/{project_key}"
+        return self._project_url
     
     def get_user_url(self, account_id: str = None) -> str:
         """사용자 API URL"""
@@ -83,8 +99,21 @@ class JiraConfig:
             "email": self.email,
             "timeout": self.timeout,
             "max_retries": self.max_retries,
+            "max_connections": self.max_connections,
+            "max_keepalive_connections": self.max_keepalive_connections,
+            "keepalive_expiry": self.keepalive_expiry,
+            "http2": self.http2,
+            "search_cache_ttl": self.search_cache_ttl,
+            "issue_cache_ttl": self.issue_cache_ttl,
+            "project_cache_ttl": self.project_cache_ttl,
+            "cache_max_size": self.cache_max_size,
             "api_base_url": self.api_base_url
         }
+    
+    @cached_property
+    def safe_dict(self) -> Mapping[str, Any]:
+        """민감한 정보를 제외한 설정 (설정은 변하지 않으므로 최초 접근 시 한 번만 생성, 읽기 전용)"""
+        return MappingProxyType(self.to_dict())
 
 
 # 전역 설정 인스턴스
@@ -1,11 +1,27 @@
 """JIRA MCP 모델들"""
 
+import re
+from functools import lru_cache
 from typing import Dict, List, Optional, Any
-from pydantic import BaseModel, Field, validator
+from pydantic import AliasGenerator, BaseModel, ConfigDict, Field, field_validator
+from pydantic.alias_generators import to_camel
 from datetime import datetime
 
 from ...shared.models import BaseResponseModel
 
+# 금지된 JQL 패턴 (description/updated 같은 JQL 필드와 구분하도록 단어 단위로 검사)
+_DANGEROUS_JQL_PATTERN = re.compile(
+    r"\b(delete|drop|truncate|update|insert|script|javascript|eval|exec)\b",
+    re.IGNORECASE
+)
+
+
+@lru_cache(maxsize=4096)
+def _find_dangerous_jql_word(jql: str) -> Optional[str]:
+    """JQL에 포함된 금지 단어 반환 (같은 쿼리가 반복되므로 쿼리 문자열별로 캐시)"""
+    match = _DANGEROUS_JQL_PATTERN.search(jql)
+    return match.group(1).lower() if match else None
+
 
 class JiraIssueRequest(BaseModel):
     """JIRA 이슈 조회 요청 모델"""
@@ -36,15 +52,9 @@ class JiraSearchRequest(BaseModel):
             raise ValueError("JQL 쿼리는 비어있을 수 없습니다")
         
         # 위험한 패턴 검사
-        dangerous_patterns = [
-            "delete", "drop", "truncate", "update", "insert",
-            "script", "javascript", "eval", "exec"
-        ]
-        
-        v_lower = v.lower()
-        for pattern in dangerous_patterns:
-            if pattern in v_lower:
-                raise ValueError(f"금지된 JQL 패턴: {pattern}")
+        forbidden = _find_dangerous_jql_word(v)
+        if forbidden:
+            raise ValueError(f"금지된 JQL 패턴: {forbidden}")
         
         return v.strip()
 
@@ -63,7 +73,23 @@ class JiraProjectRequest(BaseModel):
         return v.strip().upper()
 
 
-class JiraUser(BaseModel):
+class JiraAPIModel(BaseModel):
+    """JIRA API 응답 모델 기반 클래스
+    
+    JIRA의 camelCase 키를 그대로 검증하고, 사용하지 않는 필드는 무시합니다.
+    별칭은 검증에만 적용되므로 MCP 응답은 기존과 같이 snake_case로 직렬화됩니다.
+    캐시된 인스턴스를 여러 요청이 공유하므로 변경할 수 없도록 고정합니다.
+    """
+    
+    model_config = ConfigDict(
+        alias_generator=AliasGenerator(validation_alias=to_camel),
+        populate_by_name=True,
+        extra="ignore",
+        frozen=True
+    )
+
+
+class JiraUser(JiraAPIModel):
     """JIRA 사용자 모델"""
     
     account_id: str = Field(description="계정 ID")
@@ -73,7 +99,7 @@ class JiraUser(BaseModel):
     active: bool = Field(description="활성 상태")
 
 
-class JiraIssueType(BaseModel):
+class JiraIssueType(JiraAPIModel):
     """JIRA 이슈 타입 모델"""
     
     id: str = Field(description="이슈 타입 ID")
@@ -83,7 +109,7 @@ class JiraIssueType(BaseModel):
     subtask: bool = Field(description="서브태스크 여부")
 
 
-class JiraStatus(BaseModel):
+class JiraStatus(JiraAPIModel):
     """JIRA 상태 모델"""
     
     id: str = Field(description="상태 ID")
@@ -93,7 +119,7 @@ class JiraStatus(BaseModel):
     status_category: Optional[Dict[str, Any]] = Field(None, description="상태 카테고리")
 
 
-class JiraPriority(BaseModel):
+class JiraPriority(JiraAPIModel):
     """JIRA 우선순위 모델"""
     
     id: str = Field(description="우선순위 ID")
@@ -102,7 +128,7 @@ class JiraPriority(BaseModel):
     icon_url: Optional[str] = Field(None, description="아이콘 URL")
 
 
-class JiraProject(BaseModel):
+class JiraProject(JiraAPIModel):
     """JIRA 프로젝트 모델"""
     
     id: str = Field(description="프로젝트 ID")
@@ -115,12 +141,12 @@ class JiraProject(BaseModel):
     url: Optional[str] = Field(None, description="프로젝트 URL")
 
 
-class JiraIssueFields(BaseModel):
+class JiraIssueFields(JiraAPIModel):
     """JIRA 이슈 필드 모델"""
     
     summary: str = Field(description="요약")
     description: Optional[str] = Field(None, description="설명")
-    issue_type: JiraIssueType = Field(description="이슈 타입")
+    issue_type: JiraIssueType = Field(validation_alias="issuetype", description="이슈 타입")
     status: JiraStatus = Field(description="상태")
     priority: Optional[JiraPriority] = Field(None, description="우선순위")
     project: JiraProject = Field(description="프로젝트")
@@ -129,8 +155,8 @@ class JiraIssueFields(BaseModel):
     creator: Optional[JiraUser] = Field(None, description="생성자")
     created: Optional[datetime] = Field(None, description="생성일")
     updated: Optional[datetime] = Field(None, description="수정일")
-    resolution_date: Optional[datetime] = Field(None, description="해결일")
-    due_date: Optional[datetime] = Field(None, description="마감일")
+    resolution_date: Optional[datetime] = Field(None, validation_alias="resolutiondate", description="해결일")
+    due_date: Optional[datetime] = Field(None, validation_alias="duedate", description="마감일")
     labels: List[str] = Field(default=[], description="라벨 목록")
     components: List[Dict[str, Any]] = Field(default=[], description="컴포넌트 목록")
     versions: List[Dict[str, Any]] = Field(default=[], description="영향받는 버전")
@@ -138,7 +164,7 @@ class JiraIssueFields(BaseModel):
     custom_fields: Optional[Dict[str, Any]] = Field(None, description="커스텀 필드")
 
 
-class JiraIssue(BaseModel):
+class JiraIssue(JiraAPIModel):
     """JIRA 이슈 모델"""
     
     id: str = Field(description="이슈 ID")
@@ -148,7 +174,7 @@ class JiraIssue(BaseModel):
     changelog: Optional[Dict[str, Any]] = Field(None, description="변경 이력")
 
 
-class JiraSearchResult(BaseModel):
+class JiraSearchResult(JiraAPIModel):
     """JIRA 검색 결과 모델"""
     
     expand: str = Field(description="확장된 필드")
@@ -158,7 +184,7 @@ class JiraSearchResult(BaseModel):
     issues: List[JiraIssue] = Field(description="이슈 목록")
 
 
-class JiraComment(BaseModel):
+class JiraComment(JiraAPIModel):
     """JIRA 댓글 모델"""
     
     id: str = Field(description="댓글 ID")
@@ -169,7 +195,7 @@ class JiraComment(BaseModel):
     visibility: Optional[Dict[str, Any]] = Field(None, description="가시성 설정")
 
 
-class JiraAttachment(BaseModel):
+class JiraAttachment(JiraAPIModel):
     """JIRA 첨부파일 모델"""
     
     id: str = Field(description="첨부파일 ID")
@@ -207,4 +233,6 @@ class JiraStats(BaseModel):
     successful_requests: int = Field(description="성공한 요청 수")
     failed_requests: int = Field(description="실패한 요청 수")
     average_response_time: float = Field(description="평균 응답 시간(ms)")
+    cache_hits: int = Field(default=0, description="캐시 적중 수")
+    cache_misses: int = Field(default=0, description="캐시 미스 수")
     last_request_time: Optional[datetime] = Field(None, description="마지막 요청 시간")
\ No newline at end of file
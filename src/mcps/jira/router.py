@@ -1,12 +1,13 @@
 """JIRA MCP 라우터"""
 
-from typing import Dict, Any, Optional
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Any, Optional
 from fastapi import APIRouter, Depends, HTTPException, Query
+import pydantic
 import structlog
 
-from ...shared.utils import format_error_response, create_success_response
-from ...shared.exceptions import MCPBaseException
-from ...shared.auth import get_optional_user
+from ...shared.utils import FastJSONResponse, format_error_response, create_success_response
+from ...shared.exceptions import AuthenticationError, MCPBaseException, ValidationError
 from .client import get_jira_client, JiraClient
 from .models import (
     JiraIssueRequest,
@@ -19,7 +20,33 @@ from .models import (
 
 logger = structlog.get_logger(__name__)
 
-router = APIRouter(tags=["jira"])
+router = APIRouter(tags=["jira"], default_response_class=FastJSONResponse)
+
+# 작업별 오류 로그 메시지 (MCP 오류, 예상하지 못한 오류)
+_ERROR_LOG_MESSAGES = {
+    "search": ("JIRA search failed", "Unexpected error in JIRA search"),
+    "get_issue": ("JIRA issue retrieval failed", "Unexpected error in JIRA issue retrieval"),
+    "get_project": ("JIRA project retrieval failed", "Unexpected error in JIRA project retrieval"),
+}
+
+
+@asynccontextmanager
+async def _jira_errors(operation: str, **context: Any) -> AsyncIterator[None]:
+    """핸들러 예외를 HTTP 오류 응답으로 변환 (인증 오류 401, MCP 오류 400, 그 외 500)"""
+    try:
+        yield
+    except MCPBaseException as e:
+        logger.error(_ERROR_LOG_MESSAGES[operation][0], error=str(e), **context)
+        raise HTTPException(
+            status_code=401 if isinstance(e, AuthenticationError) else 400,
+            detail=format_error_response(e, service="jira", operation=operation)
+        )
+    except Exception as e:
+        logger.error(_ERROR_LOG_MESSAGES[operation][1], error=str(e), **context)
+        raise HTTPException(
+            status_code=500,
+            detail=format_error_response(e, service="jira", operation=operation)
+        )
 
 
 @router.get("/search",
@@ -32,51 +59,54 @@ async def search_jira_issues(
     start_at: int = Query(0, description="시작 인덱스", ge=0),
     max_results: int = Query(50, description="최대 결과 수", ge=1, le=100),
     expand: Optional[str] = Query(None, description="확장할 필드들"),
-    client: JiraClient = Depends(get_jira_client),
-    user: Optional[Dict[str, Any]] = Depends(get_optional_user)
+    no_cache: bool = Query(False, description="캐시를 무시하고 새로 조회"),
+    client: JiraClient = Depends(get_jira_client)
 ):
     """JIRA 이슈 검색"""
     
-    try:
-        logger.info(
+    async with _jira_errors("search", jql=jql):
+        logger.debug(
             "JIRA search requested",
             jql=jql,
-            max_results=max_results,
-            user_id=user.get("sub") if user else None
+            max_results=max_results
         )
         
-        # JQL 쿼리 검증은 클라이언트에서 수행
+        # 위험한 JQL은 클라이언트 호출 전에 거부
+        try:
+            request = JiraSearchRequest(
+                jql=jql,
+                start_at=start_at,
+                max_results=max_results,
+                expand=expand
+            )
+        except pydantic.ValidationError as e:
+            raise ValidationError(
+                f"잘못된 JQL 쿼리: {jql}",
+                service="jira",
+                operation="search",
+                details={"errors": [error["msg"] for error in e.errors()]}
+            )
+        
         result = await client.search_issues(
-            jql=jql,
-            start_at=start_at,
-            max_results=max_results,
-            expand=expand
+            jql=request.jql,
+            start_at=request.start_at,
+            max_results=request.max_results,
+            expand=request.expand,
+            no_cache=no_cache
         )
         
-        logger.info(
+        logger.debug(
             "JIRA search completed",
             total_results=result.total,
             returned_results=len(result.issues)
         )
         
-        return JiraSearchResponse(
+        # 클라이언트에서 검증을 마친 모델을 감싸기만 하므로 응답 래퍼는 재검증 없이 생성
+        return JiraSearchResponse.model_construct(
             success=True,
             message="JIRA 이슈 검색이 성공적으로 완료되었습니다",
             data=result
         )
-        
-    except MCPBaseException as e:
-        logger.error("JIRA search failed", error=str(e), jql=jql)
-        raise HTTPException(
-            status_code=400 if e.__class__.__name__ != "AuthenticationError" else 401,
-            detail=format_error_response(e, service="jira", operation="search")
-        )
-    except Exception as e:
-        logger.error("Unexpected error in JIRA search", error=str(e), jql=jql)
-        raise HTTPException(
-            status_code=500,
-            detail=format_error_response(e, service="jira", operation="search")
-        )
 
 
 @router.get("/issue",
@@ -87,45 +117,30 @@ async def search_jira_issues(
 async def get_jira_issue(
     issue_key: str = Query(..., description="이슈 키 (예: ABC-123)"),
     expand: Optional[str] = Query(None, description="확장할 필드들"),
-    client: JiraClient = Depends(get_jira_client),
-    user: Optional[Dict[str, Any]] = Depends(get_optional_user)
+    client: JiraClient = Depends(get_jira_client)
 ):
     """JIRA 이슈 조회"""
     
-    try:
-        logger.info(
+    async with _jira_errors("get_issue", issue_key=issue_key):
+        logger.debug(
             "JIRA issue requested",
             issue_key=issue_key,
-            expand=expand,
-            user_id=user.get("sub") if user else None
+            expand=expand
         )
         
         issue = await client.get_issue(issue_key=issue_key, expand=expand)
         
-        logger.info(
+        logger.debug(
             "JIRA issue retrieved",
             issue_key=issue_key,
             summary=issue.fields.summary
         )
         
-        return JiraIssueResponse(
+        return JiraIssueResponse.model_construct(
             success=True,
             message="JIRA 이슈 조회가 성공적으로 완료되었습니다",
             data=issue
         )
-        
-    except MCPBaseException as e:
-        logger.error("JIRA issue retrieval failed", error=str(e), issue_key=issue_key)
-        raise HTTPException(
-            status_code=400 if e.__class__.__name__ != "AuthenticationError" else 401,
-            detail=format_error_response(e, service="jira", operation="get_issue")
-        )
-    except Exception as e:
-        logger.error("Unexpected error in JIRA issue retrieval", error=str(e), issue_key=issue_key)
-        raise HTTPException(
-            status_code=500,
-            detail=format_error_response(e, service="jira", operation="get_issue")
-        )
 
 
 @router.get("/project",
@@ -136,45 +151,30 @@ async def get_jira_issue(
 async def get_jira_project(
     project_key: str = Query(..., description="프로젝트 키"),
     expand: Optional[str] = Query(None, description="확장할 필드들"),
-    client: JiraClient = Depends(get_jira_client),
-    user: Optional[Dict[str, Any]] = Depends(get_optional_user)
+    client: JiraClient = Depends(get_jira_client)
 ):
     """JIRA 프로젝트 조회"""
     
-    try:
-        logger.info(
+    async with _jira_errors("get_project", project_key=project_key):
+        logger.debug(
             "JIRA project requested",
             project_key=project_key,
-            expand=expand,
-            user_id=user.get("sub") if user else None
+            expand=expand
         )
         
         project = await client.get_project(project_key=project_key, expand=expand)
         
-        logger.info(
+        logger.debug(
             "JIRA project retrieved",
             project_key=project_key,
             name=project.name
         )
         
-        return JiraProjectResponse(
+        return JiraProjectResponse.model_construct(
             success=True,
             message="JIRA 프로젝트 조회가 성공적으로 완료되었습니다",
             data=project
         )
-        
-    except MCPBaseException as e:
-        logger.error("JIRA project retrieval failed", error=str(e), project_key=project_key)
-        raise HTTPException(
-            status_code=400 if e.__class__.__name__ != "AuthenticationError" else 401,
-            detail=format_error_response(e, service="jira", operation="get_project")
-        )
-    except Exception as e:
-        logger.error("Unexpected error in JIRA project retrieval", error=str(e), project_key=project_key)
-        raise HTTPException(
-            status_code=500,
-            detail=format_error_response(e, service="jira", operation="get_project")
-        )
 
 
 @router.get("/health",
@@ -222,7 +222,7 @@ async def jira_stats(
         logger.info("JIRA stats retrieved")
         
         return create_success_response(
-            data=stats.dict(),
+            data=stats.model_dump(),
             message="JIRA 통계 정보 조회 완료"
         )
         
@@ -250,9 +250,7 @@ async def jira_config():
                 detail="JIRA 서비스가 구성되지 않았습니다"
             )
         
-        config_info = jira_config.to_dict()
-        # 민감한 정보 제거
-        config_info.pop("api_token", None)
+        config_info = jira_config.safe_dict
         
         logger.info("JIRA config retrieved")
         
@@ -1,11 +1,14 @@
 """Slack API 클라이언트"""
 
 import asyncio
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 import httpx
 import structlog
 
-from ...shared.utils import retry_with_backoff, measure_time
+from ...shared.cache import SingleFlight, TTLCache
+from ...shared.utils import json_loads, retry_with_backoff, run_all
+from ...shared.http import get_http_client
+from ...shared.stats import RequestCounters
 from ...shared.exceptions import ExternalAPIError, AuthenticationError, RateLimitError
 from .config import slack_config
 from .models import (
@@ -28,13 +31,19 @@ class SlackClient:
             raise ValueError("Slack 설정이 초기화되지 않았습니다")
         
         self.config = slack_config
+        # 프로세스 공용 HTTP 클라이언트 (연결 풀 종료는 shared.http에서 담당)
         self.client: Optional[httpx.AsyncClient] = None
-        self.stats = SlackStats(
-            total_requests=0,
-            successful_requests=0,
-            failed_requests=0,
-            average_response_time=0.0
-        )
+        self._request_kwargs = {
+            "headers": self.config.auth_headers,
+            "timeout": self.config.timeout
+        }
+        # 평균 응답 시간은 지수 이동 평균
+        self._counters = RequestCounters(ema_alpha=0.1)
+        self._messages_sent = 0
+        # 조회 응답 TTL 캐시
+        self._cache = TTLCache(self.config.cache_max_size)
+        # 진행 중인 요청 병합 (키 → 업스트림 호출 태스크)
+        self._inflight = SingleFlight()
     
     async def __aenter__(self):
         """비동기 컨텍스트 매니저 시작"""
@@ -48,17 +57,13 @@ class SlackClient:
     async def connect(self):
         """HTTP 클라이언트 연결"""
         if self.client is None:
-            self.client = httpx.AsyncClient(
-                timeout=httpx.Timeout(self.config.timeout),
-                headers=self.config.auth_headers,
-                limits=httpx.Limits(max_keepalive_connections=5, max_connections=10)
-            )
+            # 공용 클라이언트가 종료 후 재생성되었을 수 있으므로 연결할 때마다 새로 조회
+            self.client = get_http_client()
             logger.info("Slack client connected")
     
     async def close(self):
-        """HTTP 클라이언트 종료"""
+        """HTTP 클라이언트 연결 해제 (공용 클라이언트는 닫지 않음)"""
         if self.client:
-            await self.client.aclose()
             self.client = None
             logger.info("Slack client disconnected")
     
@@ -75,37 +80,51 @@ class SlackClient:
             else:
                 raise ExternalAPIError(error_message, service="slack", operation=operation)
     
-    @measure_time
-    async def get_channel_info(self, channel: str) -> SlackChannelInfo:
+    async def get_channel_info(self, channel: str, no_cache: bool = False) -> SlackChannelInfo:
         """채널 정보 조회"""
         
+        cache_key = ("channel", channel)
+        if not no_cache:
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                return cached
+        
+        # 동일한 요청이 진행 중이면 새로 호출하지 않고 그 결과를 공유
+        return await self._inflight.do(cache_key, lambda: self._fetch_channel_info(channel, cache_key))
+    
+    async def _fetch_channel_info(self, channel: str, cache_key: Tuple) -> SlackChannelInfo:
+        """채널 정보 API 호출 (캐시 미스 시)"""
+        
         if not self.client:
             await self.connect()
         
         params = {"channel": channel}
         
         try:
-            logger.info("Slack channel info requested", channel=channel)
+            logger.debug("Slack channel info requested", channel=channel)
             
             response = await retry_with_backoff(
                 self.client,
                 "GET",
                 self.config.get_conversations_info_url(),
                 params=params,
-                max_retries=self.config.max_retries
+                max_retries=self.config.max_retries,
+                **self._request_kwargs
             )
             
-            self._update_stats(success=True, response_time=response.elapsed.total_seconds())
+            self._counters.record(success=True, response_ms=response.elapsed.total_seconds() * 1000)
             
-            data = response.json()
+            data = json_loads(response.content)
             self._handle_slack_error(data, "get_channel_info")
             
-            logger.info("Slack channel info retrieved", channel=channel, name=data.get("channel", {}).get("name"))
+            logger.debug("Slack channel info retrieved", channel=channel, name=data.get("channel", {}).get("name"))
             
-            return SlackChannelInfo(**data)
+            result = SlackChannelInfo.model_validate(data)
+            self._cache.set(cache_key, result, self.config.channel_cache_ttl)
+            return result
             
         except httpx.HTTPStatusError as e:
-            self._update_stats(success=False)
+            self._counters.record(success=False)
             logger.error("Slack channel info request failed", channel=channel, status_code=e.response.status_code)
             raise ExternalAPIError(
                 f"채널 정보 조회 실패: {e.response.status_code}",
@@ -115,11 +134,10 @@ class SlackClient:
             )
         
         except Exception as e:
-            self._update_stats(success=False)
+            self._counters.record(success=False)
             logger.error("Slack channel info error", channel=channel, error=str(e))
             raise ExternalAPIError(f"채널 정보 조회 오류: {str(e)}", service="slack", operation="get_channel_info")
     
-    @measure_time
     async def get_conversation_history(
         self,
         channel: str,
@@ -143,28 +161,29 @@ class SlackClient:
             params["latest"] = latest
         
         try:
-            logger.info("Slack conversation history requested", channel=channel, limit=limit)
+            logger.debug("Slack conversation history requested", channel=channel, limit=limit)
             
             response = await retry_with_backoff(
                 self.client,
                 "GET",
                 self.config.get_conversations_history_url(),
                 params=params,
-                max_retries=self.config.max_retries
+                max_retries=self.config.max_retries,
+                **self._request_kwargs
             )
             
-            self._update_stats(success=True, response_time=response.elapsed.total_seconds())
+            self._counters.record(success=True, response_ms=response.elapsed.total_seconds() * 1000)
             
-            data = response.json()
+            data = json_loads(response.content)
             self._handle_slack_error(data, "get_conversation_history")
             
             message_count = len(data.get("messages", []))
-            logger.info("Slack conversation history retrieved", channel=channel, message_count=message_count)
+            logger.debug("Slack conversation history retrieved", channel=channel, message_count=message_count)
             
-            return SlackConversationHistory(**data)
+            return SlackConversationHistory.model_validate(data)
             
         except httpx.HTTPStatusError as e:
-            self._update_stats(success=False)
+            self._counters.record(success=False)
             logger.error("Slack conversation history request failed", channel=channel, status_code=e.response.status_code)
             raise ExternalAPIError(
                 f"대화 히스토리 조회 실패: {e.response.status_code}",
@@ -174,11 +193,10 @@ class SlackClient:
             )
         
         except Exception as e:
-            self._update_stats(success=False)
+            self._counters.record(success=False)
             logger.error("Slack conversation history error", channel=channel, error=str(e))
             raise ExternalAPIError(f"대화 히스토리 조회 오류: {str(e)}", service="slack", operation="get_conversation_history")
     
-    @measure_time
     async def post_message(
         self,
         channel: str,
@@ -199,28 +217,29 @@ class SlackClient:
             payload["thread_ts"] = thread_ts
         
         try:
-            logger.info("Slack message post requested", channel=channel, has_thread=bool(thread_ts))
+            logger.debug("Slack message post requested", channel=channel, has_thread=bool(thread_ts))
             
             response = await retry_with_backoff(
                 self.client,
                 "POST",
                 self.config.get_chat_post_message_url(),
                 json=payload,
-                max_retries=self.config.max_retries
+                max_retries=self.config.max_retries,
+                **self._request_kwargs
             )
             
-            self._update_stats(success=True, response_time=response.elapsed.total_seconds())
-            self.stats.messages_sent += 1
+            self._counters.record(success=True, response_ms=response.elapsed.total_seconds() * 1000)
+            self._messages_sent += 1
             
-            data = response.json()
+            data = json_loads(response.content)
             self._handle_slack_error(data, "post_message")
             
             logger.info("Slack message posted", channel=channel, ts=data.get("ts"))
             
-            return SlackPostMessageResponse(**data)
+            return SlackPostMessageResponse.model_validate(data)
             
         except httpx.HTTPStatusError as e:
-            self._update_stats(success=False)
+            self._counters.record(success=False)
             logger.error("Slack message post failed", channel=channel, status_code=e.response.status_code)
             raise ExternalAPIError(
                 f"메시지 전송 실패: {e.response.status_code}",
@@ -230,41 +249,55 @@ class SlackClient:
             )
         
         except Exception as e:
-            self._update_stats(success=False)
+            self._counters.record(success=False)
             logger.error("Slack message post error", channel=channel, error=str(e))
             raise ExternalAPIError(f"메시지 전송 오류: {str(e)}", service="slack", operation="post_message")
     
-    @measure_time
-    async def get_user_info(self, user_id: str) -> SlackUserInfo:
+    async def get_user_info(self, user_id: str, no_cache: bool = False) -> SlackUserInfo:
         """사용자 정보 조회"""
         
+        cache_key = ("user", user_id)
+        if not no_cache:
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                return cached
+        
+        # 동일한 요청이 진행 중이면 새로 호출하지 않고 그 결과를 공유
+        return await self._inflight.do(cache_key, lambda: self._fetch_user_info(user_id, cache_key))
+    
+    async def _fetch_user_info(self, user_id: str, cache_key: Tuple) -> SlackUserInfo:
+        """사용자 정보 API 호출 (캐시 미스 시)"""
+        
         if not self.client:
             await self.connect()
         
         params = {"user": user_id}
         
         try:
-            logger.info("Slack user info requested", user_id=user_id)
+            logger.debug("Slack user info requested", user_id=user_id)
             
             response = await retry_with_backoff(
                 self.client,
                 "GET",
                 self.config.get_users_info_url(),
                 params=params,
-                max_retries=self.config.max_retries
+                max_retries=self.config.max_retries,
+                **self._request_kwargs
             )
             
-            self._update_stats(success=True, response_time=response.elapsed.total_seconds())
+            self._counters.record(success=True, response_ms=response.elapsed.total_seconds() * 1000)
             
-            data = response.json()
+            data = json_loads(response.content)
             self._handle_slack_error(data, "get_user_info")
             
-            logger.info("Slack user info retrieved", user_id=user_id, name=data.get("user", {}).get("name"))
+            logger.debug("Slack user info retrieved", user_id=user_id, name=data.get("user", {}).get("name"))
             
-            return SlackUserInfo(**data)
+            result = SlackUserInfo.model_validate(data)
+            self._cache.set(cache_key, result, self.config.user_cache_ttl)
+            return result
             
         except httpx.HTTPStatusError as e:
-            self._update_stats(success=False)
+            self._counters.record(success=False)
             logger.error("Slack user info request failed", user_id=user_id, status_code=e.response.status_code)
             raise ExternalAPIError(
                 f"사용자 정보 조회 실패: {e.response.status_code}",
@@ -274,10 +307,27 @@ class SlackClient:
             )
         
         except Exception as e:
-            self._update_stats(success=False)
+            self._counters.record(success=False)
             logger.error("Slack user info error", user_id=user_id, error=str(e))
             raise ExternalAPIError(f"사용자 정보 조회 오류: {str(e)}", service="slack", operation="get_user_info")
     
+    async def get_users_info_bulk(
+        self,
+        user_ids: List[str],
+        max_concurrent: int = 8
+    ) -> Dict[str, SlackUserInfo]:
+        """여러 사용자 정보를 동시에 조회 (users.info는 단건 API이므로 중복 제거 후 병렬 호출)"""
+        
+        unique_ids = list(dict.fromkeys(user_ids))
+        semaphore = asyncio.BoundedSemaphore(max_concurrent)
+        
+        async def fetch(user_id: str) -> SlackUserInfo:
+            async with semaphore:
+                return await self.get_user_info(user_id)
+        
+        results = await run_all([fetch(user_id) for user_id in unique_ids])
+        return dict(zip(unique_ids, results, strict=True))
+    
     async def health_check(self) -> Dict[str, Any]:
         """Slack 연결 상태 확인"""
         
@@ -286,23 +336,23 @@ class SlackClient:
         
         try:
             # auth.test API로 연결 상태 확인
-            response = await self.client.post(self.config.get_auth_test_url())
+            response = await self.client.post(self.config.get_auth_test_url(), **self._request_kwargs)
             response.raise_for_status()
             
-            data = response.json()
+            data = json_loads(response.content)
             if data.get("ok"):
                 return {
                     "status": "healthy",
                     "response_time_ms": response.elapsed.total_seconds() * 1000,
                     "team": data.get("team"),
                     "user": data.get("user"),
-                    "stats": self.stats.dict()
+                    "stats": self._stats_snapshot()
                 }
             else:
                 return {
                     "status": "unhealthy",
                     "error": data.get("error", "unknown"),
-                    "stats": self.stats.dict()
+                    "stats": self._stats_snapshot()
                 }
             
         except Exception as e:
@@ -310,45 +360,47 @@ class SlackClient:
             return {
                 "status": "unhealthy",
                 "error": str(e),
-                "stats": self.stats.dict()
+                "stats": self._stats_snapshot()
             }
     
-    def _update_stats(self, success: bool, response_time: float = None):
-        """통계 정보 업데이트"""
-        self.stats.total_requests += 1
-        
-        if success:
-            self.stats.successful_requests += 1
-            if response_time:
-                # 이동 평균 계산
-                if self.stats.average_response_time == 0:
-                    self.stats.average_response_time = response_time * 1000
-                else:
-                    self.stats.average_response_time = (
-                        self.stats.average_response_time * 0.9 + 
-                        response_time * 1000 * 0.1
-                    )
-        else:
-            self.stats.failed_requests += 1
+    def _stats_snapshot(self) -> Dict[str, Any]:
+        """헬스체크용 통계 (SlackStats와 같은 키, 모델 생성/직렬화 없이 카운터에서 바로 구성)"""
+        return {
+            **self._counters.snapshot(),
+            "messages_sent": self._messages_sent,
+            "channels_accessed": 0,
+            "cache_hits": self._cache.hits,
+            "cache_misses": self._cache.misses,
+            "last_request_time": None
+        }
     
     def get_stats(self) -> SlackStats:
         """통계 정보 반환"""
-        return self.stats
+        return SlackStats(**self._stats_snapshot())
 
 
 # 전역 클라이언트 인스턴스 관리
 _slack_client: Optional[SlackClient] = None
+_slack_client_lock = asyncio.Lock()
 
 
 async def get_slack_client() -> SlackClient:
     """Slack 클라이언트 인스턴스 반환"""
     global _slack_client
     
-    if _slack_client is None:
-        _slack_client = SlackClient()
-        await _slack_client.connect()
+    # 종료(close)된 인스턴스는 재사용하지 않고 새로 생성
+    client = _slack_client
+    if client is not None and client.client is not None and not client.client.is_closed:
+        return client
+    
+    async with _slack_client_lock:
+        client = _slack_client
+        if client is None or client.client is None or client.client.is_closed:
+            client = SlackClient()
+            await client.connect()
+            _slack_client = client
     
-    return _slack_client
+    return client
 
 
 async def close_slack_client():
@@ -1,6 +1,8 @@
 """Slack MCP 설정"""
 
-from typing import Dict, Any
+from functools import cached_property
+from types import MappingProxyType
+from typing import Dict, Any, Mapping
 from ...config.settings import settings
 
 
@@ -16,56 +18,55 @@ class SlackConfig:
         self.signing_secret = settings.slack.signing_secret
         self.timeout = settings.slack.timeout
         self.max_retries = settings.slack.max_retries
-    
-    @property
-    def auth_headers(self) -> Dict[str, str]:
-        """인증 헤더"""
-        return {
+        self.channel_cache_ttl = settings.slack.channel_cache_ttl
+        self.user_cache_ttl = settings.slack.user_cache_ttl
+        self.cache_max_size = settings.slack.cache_max_size
+        
+        # 요청마다 재사용하는 값은 초기화 시 한 번만 생성
+        self.auth_headers: Dict[str, str] = {
             "Authorization": f"Bearer {self.bot_token}",
             "Content-Type": "application/json"
         }
-    
-    @property
-    def api_base_url(self) -> str:
-        """Slack API 베이스 URL"""
-        return "https://slack.com/api"
+        self.api_base_url = "https://slack.com/api"
+        self._conversations_info_url = f"{self.api_base_url}/conversations.info"
+        self._conversations_history_url = f"{self.api_base_url}/conversations.history"
+        self._chat_post_message_url = f"{self.api_base_url}/chat.postMessage"
+        self._users_info_url = f"{self.api_base_url}/users.info"
+        self._users_list_url = f"{self.api_base_url}/users.list"
+        self._conversations_list_url = f"{self.api_base_url}/conversations.list"
+        self._auth_test_url = f"{self.api_base_url}/auth.test"
     
     def get_conversations_info_url(self) -> str:
         """채널 정보 조회 API URL"""
-        return f"{self.api_base_url}/conversations.info"
+        return self._conversations_info_url
     
     def get_conversations_history_url(self) -> str:
         """채널 히스토리 조회 API URL"""
-        return f"{self.api_base_url}/conversations.history"
+        return self._conversations_history_url
     
     def get_chat_post_message_url(self) -> str:
         """메시지 전송 API URL"""
-        return f"{self.api_base_url}/chat.postMessage"
+        return self._chat_post_message_url
     
     def get_users_info_url(self) -> str:
         """사용자 정보 조회 API URL"""
-        return f"{self.api_base_url}/users.info"
+        return self._users_info_url
     
     def get_users_list_url(self) -> str:
         """사용자 목록 조회 API URL"""
-        return f"{self.api_base_url}/users.list"
+        return self._users_list_url
     
     def get_conversations_list_url(self) -> str:
         """채널 목록 조회 API URL"""
-        return f"{self.api_base_url}/conversations.list"
+        return self._conversations_list_url
     
     def get_auth_test_url(self) -> str:
         """인증 테스트 API URL"""
-        return f"{self.api_base_url}/auth.test"
+        return self._auth_test_url
     
     def validate_config(self) -> bool:
         """설정 유효성 검증"""
-        required_fields = [
-            self.bot_token,
-            self.signing_secret
-        ]
-        
-        if not all(required_fields):
+        if not self.bot_token or not self.signing_secret:
             return False
         
         # 토큰 형식 기본 검증
@@ -82,11 +83,19 @@ class SlackConfig:
         return {
             "timeout": self.timeout,
             "max_retries": self.max_retries,
+            "channel_cache_ttl": self.channel_cache_ttl,
+            "user_cache_ttl": self.user_cache_ttl,
+            "cache_max_size": self.cache_max_size,
             "api_base_url": self.api_base_url,
             "bot_token_prefix": self.bot_token[:10] + "..." if self.bot_token else None,
             "app_token_configured": bool(self.app_token),
             "signing_secret_configured": bool(self.signing_secret)
         }
+    
+    @cached_property
+    def safe_dict(self) -> Mapping[str, Any]:
+        """민감한 정보를 제외한 설정 (설정은 변하지 않으므로 최초 접근 시 한 번만 생성, 읽기 전용)"""
+        return MappingProxyType(self.to_dict())
 
 
 # 전역 설정 인스턴스
@@ -1,7 +1,7 @@
 """Slack MCP 모델들"""
 
 from typing import Dict, List, Optional, Any
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field, field_validator
 from datetime import datetime
 
 from ...shared.models import BaseResponseModel
@@ -180,6 +180,8 @@ class SlackStats(BaseModel):
     average_response_time: float = Field(description="평균 응답 시간(ms)")
     messages_sent: int = Field(default=0, description="전송한 메시지 수")
     channels_accessed: int = Field(default=0, description="접근한 채널 수")
+    cache_hits: int = Field(default=0, description="캐시 적중 수")
+    cache_misses: int = Field(default=0, description="캐시 미스 수")
     last_request_time: Optional[datetime] = Field(None, description="마지막 요청 시간")
 
 
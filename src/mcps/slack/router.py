@@ -50,7 +50,8 @@ async def get_slack_channel_info(
             name=channel_info.channel.name
         )
         
-        return SlackChannelResponse(
+        # 클라이언트에서 검증을 마친 모델을 감싸기만 하므로 응답 래퍼는 재검증 없이 생성
+        return SlackChannelResponse.model_construct(
             success=True,
             message="Slack 채널 정보 조회가 성공적으로 완료되었습니다",
             data=channel_info
@@ -106,7 +107,7 @@ async def get_slack_channel_history(
             message_count=len(history.messages)
         )
         
-        return SlackHistoryResponse(
+        return SlackHistoryResponse.model_construct(
             success=True,
             message="Slack 채널 히스토리 조회가 성공적으로 완료되었습니다",
             data=history
@@ -159,7 +160,7 @@ async def send_slack_message(
             ts=response.ts
         )
         
-        return SlackMessageResponse(
+        return SlackMessageResponse.model_construct(
             success=True,
             message="Slack 메시지 전송이 성공적으로 완료되었습니다",
             data=response
@@ -206,7 +207,7 @@ async def get_slack_user_info(
             name=user_info.user.name
         )
         
-        return SlackUserResponse(
+        return SlackUserResponse.model_construct(
             success=True,
             message="Slack 사용자 정보 조회가 성공적으로 완료되었습니다",
             data=user_info
@@ -271,7 +272,7 @@ async def slack_stats(
         logger.info("Slack stats retrieved")
         
         return create_success_response(
-            data=stats.dict(),
+            data=stats.model_dump(),
             message="Slack 통계 정보 조회 완료"
         )
         
@@ -299,7 +300,7 @@ async def slack_config():
                 detail="Slack 서비스가 구성되지 않았습니다"
             )
         
-        config_info = slack_config.to_dict()
+        config_info = slack_config.safe_dict
         
         logger.info("Slack config retrieved")
         
@@ -0,0 +1,87 @@
+"""MCP 클라이언트 공용 응답 캐시 / 요청 병합"""
+
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, Hashable, Iterator, Optional, Tuple
+
+
+class TTLCache:
+    """프로세스 내 TTL 캐시 (최대 크기 초과 시 가장 오래된 항목 제거)"""
+    
+    __slots__ = ("max_size", "hits", "misses", "_entries")
+    
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        # 키 → (만료 시각, 파싱된 모델)
+        self._entries: Dict[Hashable, Tuple[float, Any]] = {}
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def __iter__(self) -> Iterator[Hashable]:
+        return iter(self._entries)
+    
+    def get(self, key: Hashable) -> Optional[Any]:
+        """캐시된 응답 조회 (만료된 항목은 제거)"""
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires_at, value = entry
+            if expires_at >= time.monotonic():
+                self.hits += 1
+                return value
+            del self._entries[key]
+        
+        self.misses += 1
+        return None
+    
+    def set(self, key: Hashable, value: Any, ttl: float):
+        """응답 캐시 저장 (ttl이 0 이하이면 저장하지 않음)"""
+        if ttl <= 0:
+            return
+        
+        entries = self._entries
+        if key not in entries and len(entries) >= self.max_size:
+            entries.pop(next(iter(entries)))
+        
+        entries[key] = (time.monotonic() + ttl, value)
+    
+    def pop(self, key: Hashable):
+        """캐시 항목 제거 (없으면 무시)"""
+        self._entries.pop(key, None)
+
+
+class SingleFlight:
+    """동일 키의 동시 요청을 하나의 업스트림 호출로 병합
+    
+    업스트림 호출은 별도 태스크에서 실행하고 모든 호출자(최초 호출자 포함)가
+    shield로 기다리므로, 한 호출자가 취소되어도 같은 키를 기다리는 다른 호출자에게
+    취소가 전파되지 않습니다.
+    """
+    
+    __slots__ = ("_tasks",)
+    
+    def __init__(self):
+        # 진행 중인 요청 (키 → 업스트림 호출 태스크)
+        self._tasks: Dict[Hashable, asyncio.Task] = {}
+    
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._tasks
+    
+    async def do(self, key: Hashable, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """진행 중인 동일 요청이 있으면 그 결과를 공유하고, 없으면 fetch 실행"""
+        task = self._tasks.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fetch())
+            self._tasks[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+        return await asyncio.shield(task)
+    
+    def _forget(self, key: Hashable, task: asyncio.Task):
+        """완료된 태스크 정리"""
+        if self._tasks.get(key) is task:
+            del self._tasks[key]
+        # 기다리던 호출자가 모두 취소된 경우에도 "exception was never retrieved" 경고가 나지 않도록 소비
+        if not task.cancelled():
+            task.exception()
@@ -66,6 +66,11 @@ class ConfigurationError(MCPBaseException):
     pass
 
 
+class CalculationError(MCPBaseException):
+    """계산 오류"""
+    pass
+
+
 def create_http_exception(
     status_code: int,
     message: str,
@@ -0,0 +1,41 @@
+"""프로세스 공용 HTTP 클라이언트"""
+
+from typing import Optional
+import httpx
+import structlog
+
+from ..config.settings import settings
+from .utils import HTTP2_ENABLED
+
+logger = structlog.get_logger(__name__)
+
+# 모든 MCP 클라이언트가 공유하는 연결 풀 (서비스별 인증/헤더는 요청마다 지정)
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """공용 HTTP 클라이언트 반환 (최초 호출 시 생성)"""
+    global _http_client
+    
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=settings.app.http_max_connections,
+                max_keepalive_connections=settings.app.http_max_keepalive_connections,
+                keepalive_expiry=settings.app.http_keepalive_expiry
+            ),
+            http2=HTTP2_ENABLED
+        )
+        logger.info("Shared HTTP client created", http2=HTTP2_ENABLED)
+    
+    return _http_client
+
+
+async def close_http_client():
+    """공용 HTTP 클라이언트 종료"""
+    global _http_client
+    
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+        logger.info("Shared HTTP client closed")
@@ -0,0 +1,47 @@
+"""MCP 클라이언트 공용 요청 통계"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+
+@dataclass(slots=True)
+class RequestCounters:
+    """요청 처리 중 갱신하는 통계 카운터 (응답용 모델은 조회 시에만 생성)
+    
+    ema_alpha가 None이면 모든 측정값을 같은 가중치로 반영하는 누적 평균,
+    값이 있으면 첫 측정값에서 시작하는 지수 이동 평균으로 평균 응답 시간을 계산합니다.
+    """
+    
+    ema_alpha: Optional[float] = None
+    total: int = 0
+    ok: int = 0
+    fail: int = 0
+    timed: int = 0
+    avg_ms: float = 0.0
+    
+    def record(self, success: bool, response_ms: Optional[float] = None):
+        """요청 결과 반영 (응답 시간은 성공한 요청만 평균에 포함)"""
+        self.total += 1
+        
+        if not success:
+            self.fail += 1
+            return
+        
+        self.ok += 1
+        if response_ms is None:
+            return
+        
+        self.timed += 1
+        if self.ema_alpha is None or self.timed == 1:
+            self.avg_ms += (response_ms - self.avg_ms) / self.timed
+        else:
+            self.avg_ms += (response_ms - self.avg_ms) * self.ema_alpha
+    
+    def snapshot(self) -> Dict[str, Any]:
+        """통계 응답 모델 공통 필드 (모델 생성/직렬화 없이 카운터에서 바로 구성)"""
+        return {
+            "total_requests": self.total,
+            "successful_requests": self.ok,
+            "failed_requests": self.fail,
+            "average_response_time": self.avg_ms
+        }
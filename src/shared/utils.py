@@ -1,10 +1,15 @@
 """공통 유틸리티 함수들"""
 
 import asyncio
+import importlib.util
+import json
+import random
+import re
 import time
-from typing import Any, Callable, TypeVar, Dict, List
-from functools import wraps
+from typing import Any, Awaitable, Callable, FrozenSet, NoReturn, Tuple, Type, TypeVar, Dict, List, Optional
+from functools import lru_cache, wraps
 import httpx
+from fastapi.responses import JSONResponse
 from tenacity import (
     retry,
     stop_after_attempt,
@@ -14,11 +19,56 @@ from tenacity import (
 )
 import structlog
 
-from .exceptions import ExternalAPIError, RateLimitError
+from .exceptions import ExternalAPIError, MCPBaseException, RateLimitError
+
+try:
+    import orjson
+except ImportError:  # orjson은 선택 의존성 (없으면 표준 json 사용)
+    orjson = None
+
+# h2 패키지가 설치된 경우에만 HTTP/2 사용 (httpx[http2])
+HTTP2_ENABLED = importlib.util.find_spec("h2") is not None
+
+# CQL 금지 패턴 (SQL 키워드는 creator/created 같은 CQL 필드와 구분하도록 단어 단위로 검사)
+CQL_FORBIDDEN_PATTERN = re.compile(
+    r"user\.|accountid|script|;|--|/\*|\*/|\b(?:drop|delete|update|insert|create|alter)\b",
+    re.IGNORECASE
+)
+
+# CQL/JQL 토큰 (따옴표 문자열 / 연산자 / 일반 단어)
+QUERY_TOKEN_PATTERN = re.compile(
+    r'"(?:[^"\\]|\\.)*"|\'(?:[^\'\\]|\\.)*\'|!=|!~|<=|>=|[=~<>(),]|[^\s"\'=~<>!(),]+|\S'
+)
 
 T = TypeVar("T")
 logger = structlog.get_logger(__name__)
 
+# 상태 코드 → (예외 클래스, 메시지 템플릿, 로그 레벨)
+StatusErrorTable = Dict[int, Tuple[Type[MCPBaseException], str, str]]
+
+
+def json_dumps(data: Any) -> bytes:
+    """JSON 직렬화 (orjson이 설치되어 있으면 orjson 사용)"""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(
+        data, ensure_ascii=False, separators=(",", ":")
+    ).encode("utf-8")
+
+
+def json_loads(data: bytes) -> Any:
+    """JSON 역직렬화 (orjson이 설치되어 있으면 orjson 사용)"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+class FastJSONResponse(JSONResponse):
+    """orjson 기반 JSON 응답 클래스"""
+    
+    def render(self, content: Any) -> bytes:
+        return json_dumps(content)
+
 
 def sanitize_input(text: str, max_length: int = 1000) -> str:
     """입력값 정리 및 검증"""
@@ -45,27 +95,28 @@ def validate_cql_query(query: str) -> str:
     """CQL 쿼리 검증 (Confluence용)"""
     query = sanitize_input(query)
     
-    # 허용된 키워드만 확인 (실제 환경에서는 더 정교한 파싱 필요)
-    allowed_keywords = [
-        "type", "title", "space", "creator", "lastmodified",
-        "and", "or", "not", "=", "~", "<", ">", "(", ")", 
-        "label", "ancestor", "parent", "content"
-    ]
-    
-    # 금지된 패턴 검사
-    forbidden_patterns = [
-        "user.", "accountid", "script", ";", "--", "/*", "*/",
-        "drop", "delete", "update", "insert", "create", "alter"
-    ]
-    
-    query_lower = query.lower()
-    for pattern in forbidden_patterns:
-        if pattern in query_lower:
-            raise ValueError(f"금지된 패턴이 포함되어 있습니다: {pattern}")
+    # 금지된 패턴 검사 (컴파일된 정규식 한 번으로 확인)
+    match = CQL_FORBIDDEN_PATTERN.search(query)
+    if match:
+        raise ValueError(f"금지된 패턴이 포함되어 있습니다: {match.group(0).lower()}")
     
     return query
 
 
+@lru_cache(maxsize=4096)
+def normalize_query(query: str, keywords: FrozenSet[str]) -> str:
+    """캐시 키용 CQL/JQL 정규화 (같은 쿼리가 반복되므로 쿼리 문자열별로 캐시)
+    
+    공백/연산자 주변 띄어쓰기와 keywords에 포함된 예약어의 대소문자 차이만 통일하고,
+    따옴표 안의 값과 필드 값은 그대로 유지합니다.
+    """
+    tokens = []
+    for token in QUERY_TOKEN_PATTERN.findall(query):
+        lowered = token.lower()
+        tokens.append(lowered if lowered in keywords else token)
+    return " ".join(tokens)
+
+
 def create_retry_decorator(
     max_attempts: int = 3,
     wait_min: float = 1.0,
@@ -82,14 +133,40 @@ def create_retry_decorator(
     )
 
 
+def _backoff_delay(attempt: int, base_delay: float, max_delay: float, jitter: bool) -> float:
+    """지수 백오프 대기 시간 계산 (jitter 사용 시 full jitter)"""
+    delay = min(max_delay, base_delay * (2 ** attempt))
+    return random.uniform(0, delay) if jitter else delay
+
+
+def _retry_after_seconds(response: httpx.Response) -> Optional[float]:
+    """Retry-After 헤더(초 단위) 파싱"""
+    value = response.headers.get("Retry-After")
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        return None
+
+
 async def retry_with_backoff(
     client: httpx.AsyncClient,
     method: str,
     url: str,
     max_retries: int = 3,
+    base_delay: float = 0.5,
+    max_delay: float = 30.0,
+    jitter: bool = False,
+    retry_request_errors: bool = True,
     **kwargs
 ) -> httpx.Response:
-    """HTTP 요청 재시도 with 지수 백오프"""
+    """HTTP 요청 재시도 with 지수 백오프
+    
+    429 응답에 Retry-After 헤더가 있으면 그 값만큼(최대 max_delay) 대기합니다.
+    연결 오류를 트랜스포트에서 이미 재시도하는 클라이언트는 retry_request_errors=False로
+    상태 코드(429/5xx) 재시도만 수행합니다.
+    """
     
     for attempt in range(max_retries):
         try:
@@ -105,7 +182,15 @@ async def retry_with_backoff(
                 if attempt == max_retries - 1:
                     response.raise_for_status()
                 
-                wait_time = (2 ** attempt) * 0.5
+                wait_time = None
+                if response.status_code == 429:
+                    wait_time = _retry_after_seconds(response)
+                    # 비정상적으로 큰 Retry-After 값으로 요청(및 병합된 대기 요청)이 멈추지 않도록 제한
+                    if wait_time is not None:
+                        wait_time = min(wait_time, max_delay)
+                if wait_time is None:
+                    wait_time = _backoff_delay(attempt, base_delay, max_delay, jitter)
+                
                 logger.warning(
                     "HTTP request failed, retrying",
                     attempt=attempt + 1,
@@ -118,13 +203,13 @@ async def retry_with_backoff(
             
             response.raise_for_status()
             return response
-            
+        
         except httpx.RequestError as e:
-            if attempt == max_retries - 1:
+            if not retry_request_errors or attempt == max_retries - 1:
                 logger.error("HTTP request failed after all retries", error=str(e), url=url)
                 raise ExternalAPIError(f"요청 실패: {str(e)}", details={"url": url})
             
-            wait_time = (2 ** attempt) * 0.5
+            wait_time = _backoff_delay(attempt, base_delay, max_delay, jitter)
             logger.warning(
                 "HTTP request error, retrying",
                 attempt=attempt + 1,
@@ -137,6 +222,59 @@ async def retry_with_backoff(
     raise ExternalAPIError("최대 재시도 횟수 초과", details={"url": url, "max_retries": max_retries})
 
 
+def raise_for_status_error(
+    error: httpx.HTTPStatusError,
+    status_errors: StatusErrorTable,
+    label: str,
+    service: str,
+    operation: str,
+    target: Optional[str] = None
+) -> NoReturn:
+    """HTTP 상태 오류를 상태 코드 표에 따라 MCP 예외로 변환
+    
+    표에 없는 상태 코드는 "{label} 실패: {상태 코드}" ExternalAPIError로 변환합니다.
+    """
+    status_code = error.response.status_code
+    entry = status_errors.get(status_code)
+    
+    if entry is None:
+        logger.error(
+            "External API request failed",
+            service=service,
+            operation=operation,
+            target=target,
+            status_code=status_code
+        )
+        raise ExternalAPIError(
+            f"{label} 실패: {status_code}",
+            status_code=status_code,
+            service=service,
+            operation=operation
+        )
+    
+    exc_cls, template, level = entry
+    message = template.format(target=target)
+    getattr(logger, level)(message, service=service, operation=operation, target=target, status_code=status_code)
+    
+    if issubclass(exc_cls, ExternalAPIError):
+        raise exc_cls(message, status_code=status_code, service=service, operation=operation)
+    raise exc_cls(message, service=service, operation=operation)
+
+
+async def run_all(coros: List[Awaitable[T]]) -> List[T]:
+    """TaskGroup으로 코루틴을 동시 실행하고 입력 순서대로 결과 반환
+    
+    하나가 실패하면 나머지 요청은 즉시 취소되고, 호출자가 기존처럼 MCP 예외를
+    처리할 수 있도록 ExceptionGroup 대신 첫 번째 예외를 그대로 전파합니다.
+    """
+    try:
+        async with asyncio.TaskGroup() as tg:
+            tasks = [tg.create_task(coro) for coro in coros]
+    except ExceptionGroup as eg:
+        raise eg.exceptions[0] from None
+    return [task.result() for task in tasks]
+
+
 def measure_time(func: Callable[..., T]) -> Callable[..., T]:
     """함수 실행 시간 측정 데코레이터"""
     
@@ -1,9 +1,14 @@
 """Confluence MCP 테스트"""
 
+import asyncio
+import httpx
 import pytest
 from unittest.mock import AsyncMock, patch
 from fastapi.testclient import TestClient
 
+from src.mcps.confluence.client import ConfluenceClient
+from src.shared.exceptions import AuthenticationError
+
 
 @pytest.fixture
 def mock_confluence_client():
@@ -95,4 +100,127 @@ def test_confluence_invalid_cql(client: TestClient, mock_confluence_client):
     response = client.get("/confluence/search?q=user.accountid")
     
     # 검증 (400 오류 예상)
-    assert response.status_code == 400
\ No newline at end of file
+    assert response.status_code == 400
+
+
+async def _connected_client(handler) -> ConfluenceClient:
+    """MockTransport로 업스트림 응답을 대신하는 Confluence 클라이언트 생성"""
+    client = ConfluenceClient(http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+    await client.connect()
+    return client
+
+
+async def test_confluence_single_flight_leader_cancel():
+    """선행 요청이 취소되어도 같은 키를 기다리는 요청은 결과를 받아야 함"""
+    release = asyncio.Event()
+    calls = []
+    
+    async def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        await release.wait()
+        return httpx.Response(200, json={"id": "1", "key": "DEV", "name": "Dev", "type": "global", "status": "current"})
+    
+    client = await _connected_client(handler)
+    
+    leader = asyncio.create_task(client.get_space("DEV"))
+    await asyncio.sleep(0)
+    follower = asyncio.create_task(client.get_space("DEV"))
+    await asyncio.sleep(0)
+    
+    leader.cancel()
+    await asyncio.sleep(0)
+    release.set()
+    
+    space = await follower
+    
+    assert leader.cancelled()
+    assert space.key == "DEV"
+    assert len(calls) == 1
+
+
+def _page_payload(page_id: str) -> dict:
+    """최소 필드만 채운 Confluence 페이지 응답"""
+    return {"id": page_id, "title": f"Page {page_id}", "type": "page", "status": "current"}
+
+
+def _batch_ids(request: httpx.Request) -> list:
+    """배치 조회 CQL(id in (...))에서 페이지 ID 목록 추출"""
+    return request.url.params["cql"][len("id in ("):-1].split(",")
+
+
+async def test_confluence_page_batch_coalesces_requests():
+    """동시에 요청된 페이지들은 한 번의 CQL 조회로 묶여야 함"""
+    requests = []
+    
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json={"results": [_page_payload(i) for i in _batch_ids(request)]})
+    
+    client = await _connected_client(handler)
+    
+    pages = await asyncio.gather(*[client.get_page(page_id) for page_id in ("1", "2", "3")])
+    
+    assert [page.id for page in pages] == ["1", "2", "3"]
+    assert len(requests) == 1
+    assert requests[0].url.path.endswith("/content/search")
+    assert sorted(_batch_ids(requests[0])) == ["1", "2", "3"]
+    assert client.get_stats().batch_size_histogram == {3: 1}
+
+
+async def test_confluence_page_batch_missing_page_falls_back():
+    """배치 응답에 없는 페이지는 단일 조회로 다시 가져와야 함"""
+    paths = []
+    
+    def handler(request: httpx.Request) -> httpx.Response:
+        paths.append(request.url.path)
+        if request.url.path.endswith("/content/search"):
+            return httpx.Response(200, json={"results": [_page_payload("1")]})
+        return httpx.Response(200, json=_page_payload(request.url.path.rsplit("/", 1)[-1]))
+    
+    client = await _connected_client(handler)
+    
+    first, second = await asyncio.gather(client.get_page("1"), client.get_page("2"))
+    
+    assert (first.id, second.id) == ("1", "2")
+    assert paths == ["/wiki/rest/api/content/search", "/wiki/rest/api/content/2"]
+
+
+async def test_confluence_page_batch_error_reaches_every_waiter():
+    """배치 조회가 실패하면 페이지별 재요청 없이 대기 중인 모든 요청이 같은 예외를 받아야 함"""
+    requests = []
+    
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(403, json={"message": "forbidden"})
+    
+    client = await _connected_client(handler)
+    
+    results = await asyncio.gather(
+        *[client.get_page(page_id) for page_id in ("1", "2", "3")],
+        return_exceptions=True
+    )
+    
+    assert all(isinstance(result, AuthenticationError) for result in results)
+    assert len(requests) == 1
+    assert requests[0].url.path.endswith("/content/search")
+
+
+async def test_confluence_page_batch_skips_cancelled_waiter():
+    """배치 실행 전에 취소된 요청은 제외하고 나머지 요청은 정상 처리해야 함"""
+    requests = []
+    
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json={"results": [_page_payload(i) for i in _batch_ids(request)]})
+    
+    client = await _connected_client(handler)
+    
+    expand = "body.storage,version"
+    futures = {page_id: client._enqueue_page(page_id, expand) for page_id in ("1", "2", "3")}
+    futures["2"].cancel()
+    
+    first, third = await asyncio.gather(futures["1"], futures["3"])
+    
+    assert (first.id, third.id) == ("1", "3")
+    assert len(requests) == 1
+    assert sorted(_batch_ids(requests[0])) == ["1", "3"]
@@ -1,9 +1,15 @@
 """JIRA MCP 테스트"""
 
+import asyncio
+import json
+import httpx
 import pytest
 from unittest.mock import AsyncMock, patch
 from fastapi.testclient import TestClient
 
+from src.mcps.jira.client import JiraClient
+from src.shared.exceptions import ExternalAPIError
+
 
 @pytest.fixture
 def mock_jira_client():
@@ -130,4 +136,131 @@ def test_jira_invalid_jql(client: TestClient, mock_jira_client):
     response = client.get("/jira/search?jql=delete+from+issues")
     
     # 검증 (400 오류 예상)
-    assert response.status_code == 400
\ No newline at end of file
+    assert response.status_code == 400
+
+
+def test_jira_search_result_camel_case_payload():
+    """JIRA camelCase 응답 파싱 테스트"""
+    from src.mcps.jira.models import JiraSearchResult
+    
+    payload = b"""{
+        "expand": "schema,names", "startAt": 50, "maxResults": 25, "total": 51,
+        "issues": [{
+            "id": "123", "key": "TEST-123", "self": "https://test.atlassian.net/rest/api/3/issue/123",
+            "fields": {
+                "summary": "Test Issue",
+                "issuetype": {"id": "1", "name": "Task", "iconUrl": "https://test/icon.png", "subtask": false},
+                "status": {"id": "1", "name": "Open", "statusCategory": {"key": "new"}},
+                "project": {"id": "1", "key": "TEST", "name": "Test Project", "projectTypeKey": "software"},
+                "assignee": {"accountId": "abc", "displayName": "Tester", "active": true},
+                "duedate": "2024-01-31T00:00:00+00:00",
+                "fixVersions": [{"name": "1.0"}],
+                "customfield_10000": "ignored"
+            }
+        }]
+    }"""
+    
+    result = JiraSearchResult.model_validate_json(payload)
+    fields = result.issues[0].fields
+    
+    # camelCase 키가 기본값으로 흘러가지 않고 그대로 채워져야 함
+    assert (result.start_at, result.max_results) == (50, 25)
+    assert fields.issue_type.icon_url == "https://test/icon.png"
+    assert fields.status.status_category == {"key": "new"}
+    assert fields.project.project_type_key == "software"
+    assert fields.assignee.account_id == "abc"
+    assert fields.due_date is not None
+    assert fields.fix_versions == [{"name": "1.0"}]
+    
+    # MCP 응답은 snake_case 유지
+    dumped = result.model_dump()
+    assert "start_at" in dumped and "startAt" not in dumped
+
+
+def _issue_payload(key: str) -> dict:
+    """최소 필드만 채운 JIRA 이슈 응답"""
+    return {
+        "id": "1", "key": key, "self": f"https://test.atlassian.net/rest/api/3/issue/{key}",
+        "fields": {
+            "summary": "Test Issue",
+            "issuetype": {"id": "1", "name": "Task", "subtask": False},
+            "status": {"id": "1", "name": "Open"},
+            "project": {"id": "1", "key": "TEST", "name": "Test Project", "projectTypeKey": "software"}
+        }
+    }
+
+
+async def test_jira_bulk_failure_does_not_cancel_shared_issue_request():
+    """일괄 조회의 다른 요청이 실패해도 같은 이슈를 기다리는 동시 요청은 결과를 받아야 함"""
+    release = asyncio.Event()
+    calls = []
+    
+    async def handler(request: httpx.Request) -> httpx.Response:
+        key = request.url.path.rsplit("/", 1)[-1]
+        calls.append(key)
+        if key == "TEST-2":
+            return httpx.Response(404, json={"errorMessages": ["not found"]})
+        await release.wait()
+        return httpx.Response(200, json=_issue_payload(key))
+    
+    client = JiraClient()
+    client.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    
+    bulk = asyncio.create_task(client.get_issues_bulk(["TEST-1", "TEST-2"]))
+    await asyncio.sleep(0.01)
+    concurrent = asyncio.create_task(client.get_issue("TEST-1"))
+    
+    # TEST-2 실패로 TaskGroup이 TEST-1 선행 요청을 취소
+    with pytest.raises(ExternalAPIError):
+        await bulk
+    release.set()
+    
+    issue = await concurrent
+    
+    assert issue.key == "TEST-1"
+    assert calls.count("TEST-1") == 1
+
+
+def test_jira_config_endpoint_redacts_secrets(client: TestClient):
+    """JIRA 설정 엔드포인트는 민감한 정보를 제외한 설정만 반환해야 함"""
+    response = client.get("/jira/config")
+    
+    assert response.status_code == 200
+    data = response.json()["data"]
+    assert data["base_url"] == "https://test.atlassian.net"
+    assert "api_token" not in data
+    assert "test-token" not in response.text
+
+
+class _ChunkedStream(httpx.AsyncByteStream):
+    """응답 본문을 작은 청크로 나눠 전송하는 스트림"""
+    
+    def __init__(self, body: bytes, chunk_size: int):
+        self._chunks = [body[i:i + chunk_size] for i in range(0, len(body), chunk_size)]
+    
+    async def __aiter__(self):
+        for chunk in self._chunks:
+            yield chunk
+
+
+async def test_jira_search_issues_stream_parses_chunked_body():
+    """ijson 스트리밍 경로는 작은 청크로 나뉜 응답에서도 이슈를 순서대로 파싱해야 함"""
+    pytest.importorskip("ijson")
+    
+    body = json.dumps({
+        "expand": "names", "startAt": 0, "maxResults": 3, "total": 3,
+        "issues": [_issue_payload(f"TEST-{i}") for i in range(1, 4)]
+    }).encode()
+    
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.url.params["jql"] == "project = TEST"
+        return httpx.Response(200, stream=_ChunkedStream(body, chunk_size=16))
+    
+    client = JiraClient()
+    client.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    
+    keys = [issue.key async for issue in client.search_issues_stream("project = TEST", max_results=3)]
+    
+    assert keys == ["TEST-1", "TEST-2", "TEST-3"]
+    assert client.get_stats().successful_requests == 1
+
@@ -3,8 +3,20 @@
 
 import sys
 import json
+import os
 from typing import Dict, Any
 
+import pytest
+from pydantic import ValidationError
+
+# `python tests/test_calculator.py`로 직접 실행할 때도 src 패키지를 찾을 수 있도록 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.mcps.calculator import router as calc_router
+from src.mcps.calculator.models import BasicCalculationRequest, ExpressionRequest
+from src.mcps.calculator.router import _safe_eval_expression
+
+
 def test_basic_math():
     """기본 수학 연산 테스트"""
     print("🧮 Testing basic calculator functions...")
@@ -227,6 +239,49 @@ def show_mcp_integration_info():
     print("\n⚠️  Note: Make sure the server is running before connecting MCP clients!")
     print("   Start server with: python scripts/start_dev.py")
 
+
+def test_safe_eval_expression():
+    """수식 계산기 AST 검증 테스트"""
+    assert _safe_eval_expression("2 + 3 * 4") == 14
+    assert _safe_eval_expression("(2 + 3) * 4") == 20
+    assert _safe_eval_expression("-10 / 4") == -2.5
+    
+    for expression in ["1, 2", "()", "2 +"]:
+        with pytest.raises(ValueError):
+            _safe_eval_expression(expression)
+
+
+def test_calculation_history_ring_buffer():
+    """계산 기록 링 버퍼 테스트"""
+    calc_router.calculation_history.clear()
+    for i in range(calc_router.calculation_history.maxlen + 5):
+        calc_router._add_to_history("add", [i, 0], float(i), 0.0)
+    
+    history = calc_router.calculation_history
+    assert len(history) == history.maxlen
+    assert history[0].result == 5.0
+    assert history[-1].result == float(history.maxlen + 4)
+    calc_router.calculation_history.clear()
+
+
+def test_expression_request_validation():
+    """수식 요청 문자/괄호 검증 테스트"""
+    assert ExpressionRequest(expression="(1 + 2) * 3").expression == "(1 + 2) * 3"
+    
+    for expression in ["1 + x", "1 + ２", "(1 + 2", ")1 + 2("]:
+        with pytest.raises(ValidationError):
+            ExpressionRequest(expression=expression)
+
+
+def test_basic_calculation_request_zero_division():
+    """0으로 나누기 요청 검증 테스트"""
+    assert BasicCalculationRequest(a=1, b=0, operation="add").b == 0
+    
+    for operation in ["divide", "modulo"]:
+        with pytest.raises(ValidationError):
+            BasicCalculationRequest(a=1, b=0, operation=operation)
+
+
 def main():
     """메인 테스트 함수"""
     print("🧪 AIDT Calculator MCP Service Test")
@@ -248,4 +303,4 @@ def main():
     show_mcp_integration_info()
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -36,4 +36,13 @@ async def test_async_client(async_client):
     assert response.status_code == 200
     
     data = response.json()
-    assert "service" in data
\ No newline at end of file
+    assert "service" in data
+
+def test_health_endpoint_cached(client: TestClient):
+    """헬스체크 응답 캐시 테스트"""
+    first = client.get("/health").json()
+    second = client.get("/health").json()
+    assert first["timestamp"] == second["timestamp"]
+    
+    fresh = client.get("/health?fresh=true").json()
+    assert fresh["timestamp"] != first["timestamp"]